@@ -67,26 +67,44 @@
 # In[105]:
 
 
-import requests
-
-# RAWG API anahtarını tanımlıyoruz
-RAWG_KEY = "762732b1ace74b74b4afac1190285ebb"
-
-# Çekmek istediğimiz endpoint: Oyun listesi
-url = "https://api.rawg.io/api/games"
-
-# Parametreler:
-# - key: API anahtarımız
+import os
+from urllib.parse import urlsplit
+from game_market.client import RawgClient
+from game_market.config import RAWG_BASE
+from game_market.cache import ResponseCache
+from game_market.lake import ResponseLake
+from game_market.telemetry import CrawlTelemetry
+
+# RAWG API anahtarı sadece RAWG_KEY ortam değişkeninden okunur (kodda anahtar tutulmaz).
+# RAWG_BASE yerel stand-in sunucusunu (game_market.standin) gösteriyorsa anahtar gerekmez
+RAWG_URL = os.environ.get("RAWG_BASE", RAWG_BASE)
+RAWG_KEY = os.environ.get("RAWG_KEY")
+if not RAWG_KEY:
+    if urlsplit(RAWG_URL).hostname not in ("127.0.0.1", "localhost"):
+        raise RuntimeError("RAWG_KEY ortam değişkeni tanımlı değil: https://rawg.io/apidocs adresinden "
+                           "ücretsiz anahtar alıp RAWG_KEY olarak ayarlayın")
+    RAWG_KEY = "standin"   # stand-in anahtarı kontrol etmez
+
+# Tüm çağrılar (smoke test, liste, detay) aynı keep-alive oturumunu kullanır.
+# Liste/detay JSON yanıtları diskte önbelleğe alınır (offline=True → ağa hiç çıkmadan sadece önbellekten).
+# Ağdan gelen her ham yanıt ayrıca data/lake altında arşivlenir → yeni sütunlar için yeniden tarama gerekmez
+# (game_market.lake.rebuild_final(fields=["playtime", "esrb_rating", ...]))
+# RAWG_BASE ortam değişkeni ile yerel stand-in sunucusuna yönlendirilebilir (game_market.standin)
+# Telemetri: uç nokta başına gecikme histogramı, byte, retry, durum kodu sayıları ve req/s
+client = RawgClient(RAWG_KEY, base=RAWG_URL,
+                    cache=ResponseCache(offline=False), lake=ResponseLake(), telemetry=CrawlTelemetry())
+
+# Çekmek istediğimiz endpoint: Oyun listesi → client.base
+# Parametreler (key client tarafından eklenir):
 # - page_size: Kaç oyun gelsin (3 ile test amaçlı sınırlıyoruz)
 # - ordering: "-metacritic" → Metacritic puanına göre azalan sıralama
 params = {
-    "key": RAWG_KEY,
     "page_size": 3,       # sadece 3 oyun gelsin
     "ordering": "-metacritic"
 }
 
-# API isteğini gönderiyoruz (15 sn timeout ile)
-r = requests.get(url, params=params, timeout=15)
+# API isteğini gönderiyoruz (timeout config'den: HTTP_TIMEOUT)
+r = client.get(client.base, params=params)
 print("status:", r.status_code)  # HTTP durum kodunu yazdır (200 → başarılı)
 
 # JSON verisini alıyoruz
@@ -125,57 +143,26 @@ for g in data.get("results", []):
 # In[13]:
 
 
-import requests, pandas as pd, time
+import pandas as pd
+
+from game_market.listing import LIST_COLUMNS, parse_list_result
+from game_market.details import fetch_game_details
 
 # 1) İlk 10 oyunu liste endpointinden çek
-BASE = "https://api.rawg.io/api/games"
-params = {"key": RAWG_KEY, "ordering": "-metacritic", "page_size": 10, "page": 1}
-r = requests.get(BASE, params=params, timeout=20)
-r.raise_for_status()
-data = r.json()
+data = client.list_games(ordering="-metacritic", page_size=10, page=1)
 
 rows = []
 for g in data["results"]:
-    rows.append({
-        "rawg_id": g["id"],
-        "name": g.get("name"),
-        "released": g.get("released"),
-        "metacritic_x": g.get("metacritic"),   # liste yanıtından gelen metacritic
-        "ratings_count": g.get("ratings_count"),
-        "added": g.get("added"),
-        "platforms": ", ".join([p["platform"]["name"] for p in (g.get("platforms") or [])])
-    })
-
-df_list = pd.DataFrame(rows)
+    rows.append(parse_list_result(g))   # metacritic_x: liste yanıtından gelen metacritic
 
-# 2) Detaylardan developers, publishers, genres, stores ekle
-def fetch_game_details(rawg_id: int, key: str) -> dict:
-    url = f"https://api.rawg.io/api/games/{rawg_id}"
-    r = requests.get(url, params={"key": key}, timeout=30)
-    r.raise_for_status()
-    d = r.json()
-
-    def join_names(lst, key="name"):
-        return ", ".join([x.get(key) for x in (lst or []) if x.get(key)]) if lst else None
-
-    stores = None
-    if d.get("stores"):
-        stores = ", ".join([(s.get("store") or {}).get("name") for s in d["stores"] if s.get("store")])
-
-    return {
-        "rawg_id": d["id"],
-        "developers": join_names(d.get("developers")),
-        "publishers": join_names(d.get("publishers")),
-        "genres": join_names(d.get("genres")),
-        "stores": stores
-    }
+df_list = pd.DataFrame(rows)[LIST_COLUMNS]
 
+# 2) Detaylardan developers, publishers, genres, stores ekle
 detail_rows = []
 for i, rid in enumerate(df_list["rawg_id"].tolist(), start=1):
-    detail_rows.append(fetch_game_details(int(rid), RAWG_KEY))
+    detail_rows.append(fetch_game_details(int(rid), client))
     if i % 3 == 0 or i == len(df_list):
         print(f"detay alındı: {i}/{len(df_list)}")
-    time.sleep(0.2)
 
 df_details = pd.DataFrame(detail_rows)
 
@@ -212,10 +199,10 @@ df_final.head(10)
 #      `rawg_id, name, released, metacritic_x, ratings_count, added, platforms, developers, publishers, genres, stores`
 # 
 # ## 2.2 Rate Limiting and Error Handling
-# - A **small delay** was added between requests (`time.sleep(0.25)`) → to be kind to the API.  
+# - Requests go through an **adaptive token-bucket limiter** instead of a fixed `time.sleep(0.25)`: the rate rises slowly while responses are healthy and halves on **429 / 5xx**; a `Retry-After` header pauses all workers.  
 # - For some old/incomplete records, the server returned **502 (Bad Gateway)**.  
-#   - In those cases, detail fields were left **empty**, and the flow continued.  
-#   - (Retry/backoff could be added if desired.)
+#   - These calls are retried with **jittered exponential backoff** (`RETRY_MAX` attempts).  
+#   - Only if every retry fails are the detail fields left **empty**, and the flow continues.
 # 
 # ## 2.3 Output
 # - Total row count: **≈ 5,000**
@@ -227,102 +214,81 @@ df_final.head(10)
 # In[17]:
 
 
-import requests, pandas as pd, time, os
+import pandas as pd, os
 from datetime import datetime
 
-RAWG_BASE = "https://api.rawg.io/api/games"
-TARGET = 5000          # hedef oyun sayısı
-PAGE_SIZE = 40
-ORDERING = "-metacritic"
-RATE_SLEEP_LIST = 0.25     # liste çağrıları arası bekleme (sn)
-RATE_SLEEP_DETAIL = 0.25   # detay çağrıları arası bekleme (sn)
+from game_market.config import TARGET, DETAIL_WORKERS, LIST_WORKERS, JOURNAL_PATH, DLQ_PATH, TELEMETRY_REPORT_PATH
+from game_market.journal import CrawlJournal
+from game_market.listing import LIST_COLUMNS, crawl_list_parallel
+from game_market.sourcing import source_fields
+from game_market.entities import EntityIndex, fetch_entities
+from game_market.deadletter import DeadLetterQueue, drain_dead_letters, apply_recovered, mark_fetch_failures
+from game_market.scheduler import CrawlScheduler
+
+# Her biten sayfa ve detay kaydı günlüğe yazılır; hücre yarıda kalıp yeniden çalışırsa kaldığı yerden devam eder.
+# Kayıt bitince günlük arşivlenir (4. adım), sonraki çalıştırma eski taramayı tekrar oynatmaz
+journal = CrawlJournal(JOURNAL_PATH)
+# Canlı ilerleme satırı: 10 sn'de bir req/s, uç nokta başına p50 / hata / retry
+client.telemetry.start_live(10)
 
 # ---------- 1) LISTE: temel alanlar ----------
-rows = []
-page = 1
+# 1. sayfadaki "count" ile sayfa kümesi baştan belli → sayfalar LIST_WORKERS kadar paralel çekilir
 print(">> Liste çekimi başlıyor...")
-while len(rows) < TARGET:
-    params = {
-        "key": RAWG_KEY,
-        "page_size": PAGE_SIZE,
-        "page": page,
-        "ordering": ORDERING
-    }
-    r = requests.get(RAWG_BASE, params=params, timeout=30)
-    r.raise_for_status()
-    data = r.json()
-
-    for g in data.get("results", []):
-        rows.append({
-            "rawg_id": g.get("id"),
-            "name": g.get("name"),
-            "released": g.get("released"),
-            "metacritic_x": g.get("metacritic"),
-            "ratings_count": g.get("ratings_count"),
-            "added": g.get("added"),
-            "platforms": ", ".join([p["platform"]["name"] for p in (g.get("platforms") or [])])
-        })
-        if len(rows) >= TARGET:
-            break
-
-    if not data.get("next"):
-        print(">> Sayfa bitti (next yok).")
-        break
-    page += 1
-    if page % 5 == 0:
-        print(f"  - İşlenen sayfa: {page}, toplanan satır: {len(rows)}")
-    time.sleep(RATE_SLEEP_LIST)
-
-df_list = pd.DataFrame(rows).drop_duplicates(subset=["rawg_id"]).reset_index(drop=True)
+rows = crawl_list_parallel(client, target=TARGET, workers=LIST_WORKERS, journal=journal)
+
+# updated da saklanır: artımlı yenileme (game_market.refresh) değişen oyunları bu sütunla bulur
+df_list = pd.DataFrame(rows)[LIST_COLUMNS + ["updated"]].drop_duplicates(subset=["rawg_id"]).reset_index(drop=True)
 print(">> Liste tamamlandı. Satır:", len(df_list))
 
 # ---------- 2) DETAY: developers, publishers, genres, stores ----------
-def fetch_game_details(rawg_id: int, key: str) -> dict:
-    url = f"https://api.rawg.io/api/games/{rawg_id}"
-    r = requests.get(url, params={"key": key}, timeout=30)
-    r.raise_for_status()
-    d = r.json()
-
-    def join_names(lst, key="name"):
-        return ", ".join([x.get(key) for x in (lst or []) if isinstance(x, dict) and x.get(key)]) if lst else None
-
-    stores = None
-    if d.get("stores"):
-        stores = ", ".join([(s.get("store") or {}).get("name") for s in d["stores"] if (s.get("store") or {}).get("name")])
-
-    return {
-        "rawg_id": d.get("id"),
-        "developers": join_names(d.get("developers")),
-        "publishers": join_names(d.get("publishers")),
-        "genres": join_names(d.get("genres")),
-        "stores": stores
-    }
-
-detail_rows = []
+# genres/stores liste yanıtında zaten var → detay uç noktası sadece eksik alanlar için çağrılır.
+# Sıralı döngü yerine sınırlı eşzamanlılık; hız sınırı ve retry/backoff client'ta (uyarlanabilir token bucket)
 print(">> Detay çekimi başlıyor...")
-for i, rid in enumerate(df_list["rawg_id"].tolist(), start=1):
-    try:
-        detail_rows.append(fetch_game_details(int(rid), RAWG_KEY))
-    except Exception as e:
-        # hata olursa boş kayıt koyup devam edelim
-        detail_rows.append({"rawg_id": int(rid), "developers": None, "publishers": None, "genres": None, "stores": None})
-        print(f"  ! detay hatası (id={rid}): {type(e).__name__} - {e}")
-    if i % 100 == 0 or i == len(df_list):
-        print(f"  - Detay ilerleme: {i}/{len(df_list)}")
-    time.sleep(RATE_SLEEP_DETAIL)
+# Detay yanıtlarındaki developer/publisher id'leri toplanır (entity profilleri için)
+# Başarısız id'ler dead-letter kuyruğuna yazılır; ana tarama onlar için beklemez
+# Öncelik: önce 84+ oyunlar, sonra added'e göre → tarama yarıda kalsa da en değerli segment tam olur
+entity_index = EntityIndex()
+dlq = DeadLetterQueue(DLQ_PATH)
+scheduler = CrawlScheduler(rows)
+detail_rows, sourcing_report = source_fields(rows, client, workers=DETAIL_WORKERS, journal=journal,
+                                             on_payload=entity_index.collect, dead_letters=dlq,
+                                             scheduler=scheduler)
+
+# Ana taramadan sonra: kuyruk düşük eşzamanlılık + kendi backoff'u ile bir kez daha denenir
+recovered = drain_dead_letters(dlq, client, journal=journal, on_payload=entity_index.collect,
+                               scheduler=scheduler)
+print(">> Kapsam:", scheduler.progress_line())
+detail_rows = apply_recovered(detail_rows, recovered)
+journal.close()
 
 df_details = pd.DataFrame(detail_rows)
 
 # ---------- 3) MERGE ----------
 df_final = df_list.merge(df_details, on="rawg_id", how="left")
+df_final = mark_fetch_failures(df_final, dlq)   # detail_status: "ok" (boşluk gerçek) / "fetch_failed"
+dlq.close()
 print(">> Birleştirildi. Boyut:", df_final.shape)
 
+# ---------- 3b) ENTITY: developer/publisher profilleri (her biri tek sefer) ----------
+failed = df_final.loc[df_final["detail_status"] == "fetch_failed", "rawg_id"]
+entity_index.fill_missing(df_final["rawg_id"], client, skip=failed, workers=DETAIL_WORKERS)   # günlükten gelen satırlar (önbellekten)
+df_entities = fetch_entities(entity_index, client, workers=DETAIL_WORKERS)
+df_game_entities = entity_index.game_entities()         # rawg_id ↔ (kind, entity_id) köprü tablosu
+print(">> Entity:", len(df_entities), "| bağlantı:", len(df_game_entities))
+print(">> HTTP:", client.stats())   # istek / açılan bağlantı / yeniden kullanım / wire byte
+client.telemetry.stop_live()
+print(">> Telemetri raporu:", client.telemetry.write_report(TELEMETRY_REPORT_PATH))
+client.close()   # HTTP havuzu kapanır; ham yanıt arşivinde bekleyen kayıtlar diske yazılır
+
 # ---------- 4) KAYDET ----------
 os.makedirs("data", exist_ok=True)
 stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
 out_csv = f"data/rawg_{len(df_final)}_games_{stamp}.csv"
 df_final.to_csv(out_csv, index=False)
+df_entities.to_csv(f"data/rawg_entities_{stamp}.csv", index=False)
+df_game_entities.to_csv(f"data/rawg_game_entities_{stamp}.csv", index=False)
 print(">> Kaydedildi:", out_csv)
+print(">> Günlük arşivlendi:", journal.archive(stamp))   # sonraki çalıştırma yeni tarama yapar
 
 # ---------- 5) ÖZET ----------
 print("\nÖrnek satırlar:")
@@ -336,12 +302,28 @@ print("\nSütunlar:", list(df_final.columns))
 # - The final `df_final` table was written to disk in **CSV** format:  
 #   `rawg_5000_games.csv`
 # - The file was made accessible via a downloadable link in Jupyter (`FileLink`).
+# - When `pyarrow` is installed, a columnar copy is also written: `rawg_5000_games.parquet`  
+#   (real list columns for platforms/developers/publishers/genres/stores, dictionary-encoded names, typed numbers;  
+#   `game_market.dataset.read_games` reads only the requested columns and skips row groups ruled out by filters).
+# - A normalized SQLite database is written to `data/rawg_games.sqlite` (`games`, one table per genre/developer/publisher/store/platform  
+#   and a bridge table for each, indexed on (entity_id, metacritic) and release_year). The section 4–7 counts, 84+ rates and medians  
+#   are available as SQL queries: `game_market.database.entity_stats`, `entity_medians`, `year_stats`.
+# - The numeric columns (ids, scores, counts, release year/month/day, entity-id offsets) are cached as memory-mapped arrays  
+#   under `data/mmap_cache/<sha256 of the CSV>/`; `game_market.mmapcache.load_columns` opens them without parsing the CSV again.
+# - Genre/developer/publisher/store/platform names are interned to integer ids (`game_market.vocab.EntityVocab`, saved to `data/entity_vocab.json`).  
+#   An alias table (`config.ENTITY_ALIASES`, which now holds the store mapping) and case/spacing folding ("NAMCO" / "Namco") merge variants first,  
+#   so every section groups on the same integer keys.
 # 
 # ## Date Format Adjustment
 # - In some rows, the `released` column was returned as a string.  
-# - Converted to **datetime** type using Pandas `to_datetime(..., errors="coerce")`.  
+# - Converted to **datetime** type once, at load time (`game_market.dates.parse_dates`): the format (ISO `YYYY-MM-DD` or `M/D/YYYY`)  
+#   is detected per column and parsed with a fixed format, so a mixed column is never half lost to format inference.  
 #   - Invalid/empty values were marked as `NaT`.  
+#   - `release_year`, `release_month` and `release_ordinal` integer columns are derived in the same step; later sections read them instead of re-parsing.
 # - This step was necessary for use in time-series analyses (`.dt.year`, etc.).
+# - The conversion is part of a declared schema (`game_market.schema.apply_schema`): `metacritic_x` → UInt8, counts → Int32,  
+#   name lists → categorical, `name` → Arrow-backed string. Out-of-range or unparseable values become missing in one vectorized pass,  
+#   and memory per row is printed before and after (about 90 bytes per game afterwards).
 # 
 # > At the end of this step, the dataset was both **archived** and **ready for analysis**.
 
@@ -350,6 +332,23 @@ print("\nSütunlar:", list(df_final.columns))
 
 df_final.to_csv("rawg_5000_games.csv", index=False)
 
+# Sütunsal kopya (pyarrow varsa): gerçek liste sütunları, sözlük kodlu isimler, tipli sayısal sütunlar.
+# Bölümler sadece gereken sütun/satırları okur: read_games(path, columns=[...], filters=[("metacritic_x", ">=", 84)])
+from game_market.dataset import HAS_PYARROW, write_games
+if HAS_PYARROW:
+    write_games(df_final, "rawg_5000_games.parquet", df_game_entities, df_entities)
+
+# Normalize SQLite kopyası: games + genres/developers/publishers/stores/platforms + köprü tabloları.
+# Bölüm 4–7 sayım / 84+ oranı / medyanları indeksli SQL ile: game_market.database.entity_stats, entity_medians
+from game_market.config import SQLITE_PATH
+from game_market.database import build_database
+build_database(df_final, SQLITE_PATH, df_game_entities, df_entities)
+
+# Sayısal sütunların mmap önbelleği (CSV'nin sha256 özetine göre): sonraki oturumlar CSV'yi yeniden
+# ayrıştırmadan load_columns("rawg_5000_games.csv")["metacritic_x"] ile sıfır kopya okur
+from game_market.mmapcache import build_column_cache
+build_column_cache("rawg_5000_games.csv")
+
 
 # In[19]:
 
@@ -361,7 +360,21 @@ FileLink("rawg_5000_games.csv")
 # In[21]:
 
 
-df_final["released"] = pd.to_datetime(df_final["released"], errors="coerce")
+# Beyan edilmiş şema (game_market.schema): UInt8 skor, Int32 sayılar, datetime released,
+# kategorik isim sütunları, Arrow string; geçersiz değerler tek vektörel geçişte NA yapılır
+from game_market.schema import apply_schema
+df_final, schema_report = apply_schema(df_final)
+print(">> Bellek:", schema_report["bytes_per_row_before"], "→", schema_report["bytes_per_row_after"],
+      "byte/satır | geçersiz:", schema_report["invalid"])
+
+# Varlık sözlüğü (game_market.vocab): her isim tek tamsayı kimliğe iner; takma adlar (config.ENTITY_ALIASES,
+# eski store_mapping dahil) ve "NAMCO"/"Namco" gibi yazım farkları birleşir. Sözlük veri kümesiyle birlikte
+# kaydedilir, sonraki sürümler aynı kimlikleri alır; bölüm 4–7 bu oyun × varlık matrisleri üzerinden gruplar
+from game_market.config import ENTITY_VOCAB_PATH
+from game_market.vocab import load_vocab
+vocab = load_vocab(ENTITY_VOCAB_PATH)
+incidences = vocab.incidences(df_final)
+vocab.save(ENTITY_VOCAB_PATH)
 
 
 # # 3. Time Trends — Average Metacritic by Year
@@ -371,8 +384,7 @@ df_final["released"] = pd.to_datetime(df_final["released"], errors="coerce")
 # This analysis provides a baseline reference for the question: *“If a new game is released today, what is the current quality benchmark in the market?”*
 # 
 # **Method (summary):**
-# - Converted `released` date to `datetime` type (`errors="coerce"`).
-# - Extracted `year = released.dt.year` for each game.
+# - Used the `release_year` column derived once in section 2.4 (no date re-parsing).
 # - Grouped by year and calculated the average of `metacritic_x`.
 # 
 # **Chart interpretation (expected insights):**
@@ -385,17 +397,14 @@ df_final["released"] = pd.to_datetime(df_final["released"], errors="coerce")
 # In[127]:
 
 
-# "released" kolonunu datetime formatına çeviriyoruz
-# errors="coerce" → hatalı tarihleri NaT (eksik değer) yapar
-df_final["released"] = pd.to_datetime(df_final["released"], errors="coerce")
-
+# Tarih 2.4'te bir kez ayrıştırıldı; yıl release_year sütunundan okunur (yeniden ayrıştırma yok)
 import matplotlib.pyplot as plt
 
 # Yıllara göre ortalama Metacritic hesaplama
 df_year = (
     df_final
-    .dropna(subset=["released","metacritic_x"])   # eksik tarih veya metacritic olan satırları at
-    .assign(year=lambda d: d["released"].dt.year) # tarih kolonundan sadece yılı çıkar
+    .dropna(subset=["release_year","metacritic_x"])   # eksik tarih veya metacritic olan satırları at
+    .assign(year=lambda d: d["release_year"])         # 2.4'te türetilen yıl sütunu
     .groupby("year", as_index=False)["metacritic_x"].mean()  # yıl bazında ortalama metacritic al
 )
 
@@ -452,8 +461,8 @@ THRESH = 84  #  Baraj değerimiz (Metacritic 84 ve üzeri oyunları alacağız)
 # Veri hazırlığı
 df_ge = (
     df_final
-    .dropna(subset=["released","metacritic_x"])     # geçersiz tarih veya metacritic verilerini at
-    .assign(year=lambda d: d["released"].dt.year)   # yıl bilgisi ekle
+    .dropna(subset=["release_year","metacritic_x"]) # geçersiz tarih veya metacritic verilerini at
+    .assign(year=lambda d: d["release_year"])       # yıl bilgisi (2.4'te türetildi)
     .query("metacritic_x >= @THRESH")               # sadece 84+ oyunları filtrele
     .groupby("year", as_index=False)                # yıl bazında grupla
     .size()                                         # oyun sayısını hesapla
@@ -614,31 +623,19 @@ import matplotlib.pyplot as plt
 # Hariç tutulacak türler
 EXCLUDE_GENRES = {"Indie"}   # Oyun tarzlarına göre baktığımız için, indie olan bir oyun mesala metroidvania da olabildiği için indie yi tür olarak almıyoruz.
 
-# genres + ilgi metrikleri için uzun form (Indie hariç)
-rows = []
-src = df_final.dropna(subset=["genres"])
-for _, row in src.iterrows():
-    g_list = [g.strip() for g in row["genres"].split(",") if g.strip()]
-    rc = row.get("ratings_count")
-    ad = row.get("added")
-    for g in g_list:
-        if g in EXCLUDE_GENRES:
-            continue
-        rows.append({
-            "genre": g,
-            "ratings_count": float(rc) if pd.notna(rc) else None,
-            "added": float(ad) if pd.notna(ad) else None
-        })
-
-gpop = pd.DataFrame(rows)
+# oyun × tür incidence matrisi (Indie hariç)
+ginc = incidences["genres"].fold(exclude=EXCLUDE_GENRES)
 
 # Tür bazında medyan ilgi metrikleri (ve örnek sayısı)
 agg_pop = (
-    gpop.groupby("genre", as_index=False)
-        .agg(n=("ratings_count","size"),
-             median_ratings=("ratings_count","median"),
-             median_added=("added","median"))
+    pd.DataFrame({"genre": ginc.names,
+                  "n": ginc.totals().astype(int),
+                  "median_ratings": ginc.medians(df_final["ratings_count"]),
+                  "median_added": ginc.medians(df_final["added"])})
+        .loc[lambda d: d["n"] > 0]
+        .sort_values("genre")
         .fillna(0)
+        .reset_index(drop=True)
 )
 
 top_ratings = agg_pop.sort_values("median_ratings", ascending=False).head(15)
@@ -708,29 +705,14 @@ plt.show()
 
 import pandas as pd
 import matplotlib.pyplot as plt
-from collections import Counter
 
 THRESH = 84
 
-# 1) Developer'ları explode ederek satırlaştır
-rows = []
-for _, row in df_final.dropna(subset=["developers", "metacritic_x"]).iterrows():
-    for d in row["developers"].split(","):
-        dev = d.strip()
-        if dev:
-            rows.append({"developer": dev, "metacritic": float(row["metacritic_x"])})
-
-devdf = pd.DataFrame(rows)
-
-# 2) Metrikler: toplam oyun sayısı, 84+ sayısı, 84+ oranı
-agg = (
-    devdf
-    .assign(ge84=lambda d: (d["metacritic"] >= THRESH).astype(int))
-    .groupby("developer", as_index=False)
-    .agg(n_total=("metacritic","size"),
-         n_ge84=("ge84","sum"))
-)
-agg["rate_ge84"] = (agg["n_ge84"] / agg["n_total"] * 100).round(1)
+# 1) oyun × developer incidence matrisi
+dinc = incidences["developers"]
+
+# 2) Metrikler: toplam oyun sayısı, 84+ sayısı, 84+ oranı (puanı olan oyunlar üzerinden)
+agg = dinc.stats(df_final["metacritic_x"], THRESH).rename(columns={"name": "developer"})
 
 # 3) Görselleştirme: Top 15 (rekabet & elit başarı)
 top_by_total = agg.sort_values("n_total", ascending=False).head(15)
@@ -847,27 +829,11 @@ import matplotlib.pyplot as plt
 
 THRESH = 84
 
-# 1) Publisher'ları explode ederek tablo oluştur
-rows = []
-src = df_final.dropna(subset=["publishers", "metacritic_x"])
-for _, row in src.iterrows():
-    score = float(row["metacritic_x"])
-    for p in row["publishers"].split(","):
-        pub = p.strip()
-        if pub:
-            rows.append({"publisher": pub, "metacritic": score})
-
-pubdf = pd.DataFrame(rows)
+# 1) oyun × publisher incidence matrisi
+pinc = incidences["publishers"]
 
 # 2) Hacim (n_total), 84+ sayısı (n_ge84), oran
-agg_pub = (
-    pubdf
-    .assign(ge84=lambda d: (d["metacritic"] >= THRESH).astype(int))
-    .groupby("publisher", as_index=False)
-    .agg(n_total=("metacritic", "size"),
-         n_ge84=("ge84", "sum"))
-)
-agg_pub["rate_ge84"] = (agg_pub["n_ge84"] / agg_pub["n_total"] * 100).round(1)
+agg_pub = pinc.stats(df_final["metacritic_x"], THRESH).rename(columns={"name": "publisher"})
 
 # 3) Görselleştirme — Top 15 (hacim ve 84+ sayısı)
 top_total = agg_pub.sort_values("n_total", ascending=False).head(15)
@@ -898,14 +864,19 @@ plt.show()
 # In[128]:
 
 
+import pandas as pd
+
 # Publisher bazında toplam oyun ve 84+ oyun sayısı + oran
+# Ortak yayınlanan oyun ("Bandai Namco Entertainment, Namco") her publisher'ına ayrı sayılır;
+# iki sayım da oyun × publisher matrisiyle tek çarpım (incidences, bölüm 2.4)
+pinc = incidences["publishers"]
 pub_stats = (
-    df_final.groupby("publishers")
-    .agg(
-        total_games=("rawg_id", "count"),
-        high84_games=("rawg_id", lambda idx: (df_final.loc[idx.index, "metacritic_x"] >= 84).sum())
-    )
-    .reset_index()
+    pd.DataFrame({"publishers": pinc.names,
+                  "total_games": pinc.totals().astype(int),
+                  "high84_games": pinc.totals(mask=df_final["metacritic_x"].ge(84)).astype(int)})
+    .loc[lambda d: d["total_games"] > 0]
+    .sort_values("publishers")
+    .reset_index(drop=True)
 )
 
 # Oran (%)
@@ -1017,48 +988,18 @@ plt.show()
 # In[125]:
 
 
-from collections import Counter
 import pandas as pd
+# oyun × store incidence matrisi; konsol nesilleri (Xbox 360/One/Series, PlayStation 3/4/5 Store)
+# config.ENTITY_ALIASES["stores"] ile tek mağazada birleşir
+sinc = incidences["stores"]
 
-# --- Mapping: farklı isimleri ortak gruba çevir ---
-store_mapping = {
-    "Xbox 360 Store": "Xbox Store",
-    "Xbox One Store": "Xbox Store",
-    "Xbox Series S/X Store": "Xbox Store",
-    "PlayStation 3 Store": "PlayStation Store",
-    "PlayStation 4 Store": "PlayStation Store",
-    "PlayStation 5 Store": "PlayStation Store"
-}
-
-def normalize_store(name):
-    return store_mapping.get(name, name)
-
-# --- 1) Tüm oyunlarda store sayıları ---
-all_stores = []
-for s in df_final["stores"].dropna():
-    for st in s.split(","):
-        all_stores.append(normalize_store(st.strip()))
-
-store_counts_all = Counter(all_stores)
-df_stores_all = pd.DataFrame(store_counts_all.items(), columns=["store", "total_games"])
-
-# --- 2) Sadece 84+ oyunlar ---
-all_stores_84 = []
-for s in df_final.loc[df_final["metacritic_x"] >= 84, "stores"].dropna():
-    for st in s.split(","):
-        all_stores_84.append(normalize_store(st.strip()))
-
-store_counts_84 = Counter(all_stores_84)
-df_stores_84 = pd.DataFrame(store_counts_84.items(), columns=["store", "high84_games"])
-
-# --- 3) Birleştir ve oran hesapla ---
+# --- 1) Tüm oyunlarda store sayıları, 2) sadece 84+ oyunlar, 3) oran ---
 df_store_stats = (
-    df_stores_all.merge(df_stores_84, on="store", how="left")
-    .fillna(0)
-    .assign(
-        high84_games=lambda d: d["high84_games"].astype(int),
-        high84_ratio=lambda d: (d["high84_games"] / d["total_games"] * 100).round(1)
-    )
+    pd.DataFrame({"store": sinc.names,
+                  "total_games": sinc.totals().astype(int),
+                  "high84_games": sinc.totals(mask=df_final["metacritic_x"].ge(84)).astype(int)})
+    .loc[lambda d: d["total_games"] > 0]
+    .assign(high84_ratio=lambda d: (d["high84_games"] / d["total_games"] * 100).round(1))
     .sort_values("total_games", ascending=False)
     .reset_index(drop=True)
 )
@@ -1168,11 +1109,11 @@ top10_stores
 top95_games = df_final[df_final["metacritic_x"] >= 95]
 
 # İlgili kolonları seç ve sıralamayı puana göre yap
-top95_games = top95_games[["released", "name", "developers", "publishers", "metacritic_x"]] \
+top95_games = top95_games[["release_year", "name", "developers", "publishers", "metacritic_x"]] \
     .sort_values("metacritic_x", ascending=False)
 
 # Yılı ayrı bir kolon olarak ekle
-top95_games["year"] = top95_games["released"].dt.year
+top95_games["year"] = top95_games["release_year"]
 
 # Kolonları yeniden sırala
 top95_games = top95_games[["year", "name", "developers", "publishers", "metacritic_x"]]
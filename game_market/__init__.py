@@ -0,0 +1,5 @@
+"""Data collection helpers for the RAWG game market analysis.
+
+The notebooks (``Game_Market_Analysis_EN/TR``) import from this package so the
+crawl logic lives in one place instead of being copied between cells.
+"""
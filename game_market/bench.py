@@ -0,0 +1,114 @@
+"""Offline crawl benchmark: every crawler mode against a :class:`~game_market.standin.StandInServer`.
+
+    python -m game_market.bench --games 2000 --target 1000 --latency lognormal 0.08 0.5 --rate-429 0.01
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import time
+
+import numpy as np
+
+from .client import RawgClient
+from .config import DETAIL_WORKERS, LIST_WORKERS, PAGE_SIZE, RATE_MAX
+from .details import enrich_details
+from .listing import crawl_list, crawl_list_parallel
+from .ratelimit import AdaptiveRateLimiter
+from .sourcing import source_fields
+from .standin import Latency, StandInServer, synthetic_catalog
+
+
+def _sequential(client, target):
+    rows = crawl_list(client, target=target, page_size=PAGE_SIZE)
+    details = enrich_details([r["rawg_id"] for r in rows], client, workers=1)
+    return len(rows), sum(d.get("developers") is not None for d in details)
+
+
+def _parallel(client, target):
+    rows = crawl_list_parallel(client, target=target, page_size=PAGE_SIZE, workers=LIST_WORKERS)
+    details = enrich_details([r["rawg_id"] for r in rows], client, workers=DETAIL_WORKERS)
+    return len(rows), sum(d.get("developers") is not None for d in details)
+
+
+def _sourced(client, target):
+    rows = crawl_list_parallel(client, target=target, page_size=PAGE_SIZE, workers=LIST_WORKERS)
+    details, _ = source_fields(rows, client, workers=DETAIL_WORKERS)
+    return len(rows), sum(d.get("developers") is not None for d in details)
+
+
+# mod adı -> (client, target) -> (liste satırı, detaylı satır)
+MODES = {"sequential": _sequential, "parallel": _parallel, "sourced": _sourced}
+
+
+def run_mode(mode: str, server: StandInServer, target: int, rate: float = RATE_MAX, quiet: bool = True) -> dict:
+    """One crawl in ``mode`` against ``server`` → req/s, p50/p99 latency (ms) and total time."""
+    latencies = []
+    limiter = AdaptiveRateLimiter(rate=rate, max_rate=max(rate, RATE_MAX))
+    with RawgClient("bench", base=server.base, limiter=limiter,
+                    pool_maxsize=max(DETAIL_WORKERS, LIST_WORKERS)) as client:
+        client.session.hooks["response"].append(lambda r, *a, **kw: latencies.append(r.elapsed.total_seconds()))
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            n_rows, n_detailed = MODES[mode](client, target)
+        total = time.perf_counter() - t0
+        stats = client.stats()
+    lat = np.asarray(latencies) * 1000
+    return {
+        "mode": mode,
+        "rows": n_rows,
+        "detailed": n_detailed,
+        "requests": stats["requests"],
+        "retried": stats["retried"],
+        "req_per_s": round(stats["requests"] / total, 1) if total else None,
+        "p50_ms": round(float(np.percentile(lat, 50)), 1) if lat.size else None,
+        "p99_ms": round(float(np.percentile(lat, 99)), 1) if lat.size else None,
+        "total_s": round(total, 2),
+    }
+
+
+def run_benchmark(modes=None, games=None, target: int = 1000, latency: Latency = None, rate_429: float = 0.0,
+                  rate_502: float = 0.0, bad_ids=(), rate: float = RATE_MAX, seed: int = 0) -> list:
+    """Run each mode on a fresh stand-in (same fixtures, same fault seed) and return one result per mode."""
+    games = games if games is not None else synthetic_catalog(max(target, 1), seed=seed)
+    results = []
+    for mode in modes or list(MODES):
+        with StandInServer(games, latency=latency, rate_429=rate_429, rate_502=rate_502, retry_after=0.2,
+                           bad_ids=bad_ids, seed=seed) as server:
+            results.append(run_mode(mode, server, target, rate=rate))
+    return results
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    p.add_argument("--games", type=int, default=2000, help="synthetic catalogue size")
+    p.add_argument("--fixtures", help="games CSV (df_final export) instead of a synthetic catalogue")
+    p.add_argument("--target", type=int, default=1000)
+    p.add_argument("--latency", nargs=3, metavar=("KIND", "A", "B"), default=["lognormal", "0.05", "0.5"])
+    p.add_argument("--rate-429", type=float, default=0.0)
+    p.add_argument("--rate-502", type=float, default=0.0)
+    p.add_argument("--rate", type=float, default=RATE_MAX, help="starting limiter rate (req/s)")
+    p.add_argument("--json", action="store_true", help="print results as JSON")
+    args = p.parse_args(argv)
+
+    if args.fixtures:
+        from .standin import fixtures_from_csv
+        games = fixtures_from_csv(args.fixtures)
+    else:
+        games = synthetic_catalog(args.games)
+    kind, a, b = args.latency
+    results = run_benchmark(args.modes, games, args.target, Latency(kind, float(a), float(b), seed=0),
+                            args.rate_429, args.rate_502, rate=args.rate)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    cols = list(results[0])
+    print("  ".join(f"{c:>10}" for c in cols))
+    for r in results:
+        print("  ".join(f"{str(r[c]):>10}" for c in cols))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Content-addressed on-disk cache for RAWG JSON responses."""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+from .config import CACHE_DIR, CACHE_MAX_BYTES, CACHE_TTL
+
+
+class CacheMiss(LookupError):
+    """Raised in offline mode when a response is not cached."""
+
+
+def cache_key(url: str, params=None) -> str:
+    """sha256 of the normalized URL + sorted params, without the API key."""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/") or "/"
+    query = sorted((k, str(v)) for k, v in (params or {}).items() if k != "key")
+    norm = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+    return hashlib.sha256(norm.encode("utf-8")).hexdigest()
+
+
+def endpoint_of(url: str) -> str:
+    """``"detail"`` for ``/games/{id}``-style URLs, ``"list"`` otherwise."""
+    last = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+    return "detail" if last.isdigit() else "list"
+
+
+class ResponseCache:
+    """gzip-compressed JSON bodies under ``root/<2 hex>/<sha256>.json.gz``.
+
+    Every entry stores its fetch time, and entries older than the endpoint's
+    TTL (``ttl["list"]`` / ``ttl["detail"]``, in seconds) count as stale. A
+    hit touches the file's mtime. When the cache grows past ``max_bytes``,
+    the least recently used files are deleted first. With ``offline=True``
+    stale entries are still served and a miss raises :class:`CacheMiss`
+    instead of going to the network.
+    """
+
+    def __init__(self, root: str = CACHE_DIR, ttl=None, max_bytes: int = CACHE_MAX_BYTES,
+                 offline: bool = False):
+        self.root = root
+        self.ttl = dict(CACHE_TTL, **(ttl or {}))
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.hits = self.misses = self.stale = self.evictions = 0
+        self._lock = threading.Lock()
+        self._index = {}    # path → (size, last access)
+        os.makedirs(root, exist_ok=True)
+        for sub in os.scandir(root):
+            if sub.is_dir():
+                for f in os.scandir(sub.path):
+                    try:
+                        st = f.stat()
+                    except FileNotFoundError:   # başka bir süreç o an sildi/taşıdı
+                        continue
+                    self._index[f.path] = (st.st_size, st.st_mtime)
+        self._size = sum(size for size, _ in self._index.values())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key + ".json.gz")
+
+    def get(self, url: str, params=None):
+        """Cached body or ``None`` (miss or stale)."""
+        path = self._path(cache_key(url, params))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):     # FileNotFoundError dahil
+            return self._miss(url)
+        now = time.time()
+        if not self.offline and now - entry["fetched"] > self.ttl[endpoint_of(url)]:
+            with self._lock:
+                self.stale += 1
+            return None
+        try:
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            # okuma ile utime arasında başka bir thread dosyayı sildi (eviction)
+            return self._miss(url)
+        with self._lock:
+            self.hits += 1
+            if path in self._index:
+                self._index[path] = (self._index[path][0], now)
+        return entry["body"]
+
+    def _miss(self, url: str):
+        with self._lock:
+            self.misses += 1
+        if self.offline:
+            raise CacheMiss(url)
+        return None
+
+    def put(self, url: str, params, body) -> None:
+        path = self._path(cache_key(url, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"   # shard süreçleri aynı önbelleği paylaşır
+        with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+            json.dump({"fetched": time.time(), "body": body}, fh, ensure_ascii=False)
+        os.replace(tmp, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            old = self._index.get(path, (0, 0))[0]
+            self._index[path] = (size, time.time())
+            self._size += size - old
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # en uzun süredir kullanılmayan dosyalar önce silinir (LRU)
+        for path, (size, _) in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+            if self._size <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            del self._index[path]
+            self._size -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale,
+                "evictions": self.evictions, "entries": len(self._index), "bytes": self._size}
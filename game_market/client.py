@@ -0,0 +1,174 @@
+"""Pooled HTTP client used by every RAWG call (smoke test, list crawl, detail crawl)."""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import (HTTP_TIMEOUT, POOL_MAXSIZE, RATE_DECREASE_ERROR, RAWG_BASE, RETRY_MAX, RETRY_STATUS,
+                     THROTTLE_STATUS)
+from .ratelimit import AdaptiveRateLimiter, backoff_delay
+
+
+def retry_after_seconds(value):
+    """``Retry-After`` header (seconds or HTTP date) → seconds, or ``None``."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RawgClient:
+    """One keep-alive ``requests.Session`` per crawl.
+
+    Connections are pooled per host (``pool_maxsize`` of them), responses are
+    requested gzip-encoded and the API key is added to every call. ``stats()``
+    reports how many requests reused an open connection and how many bytes
+    actually crossed the wire versus the decoded body size.
+
+    Every network call first takes a token from the shared
+    :class:`~game_market.ratelimit.AdaptiveRateLimiter`. :meth:`get_json`
+    retries 429/5xx responses and connection errors with jittered exponential
+    backoff (``Retry-After`` wins when the server sends it) and feeds each
+    outcome back to the limiter: 429/503 halve the rate, while other 5xx (for
+    example RAWG's per-record 502s) only trim it.
+
+    With a :class:`~game_market.cache.ResponseCache`, :meth:`get_json` serves
+    cached bodies first and only goes to the network on a miss. With a
+    :class:`~game_market.lake.ResponseLake`, every body fetched from the
+    network is also archived raw. With a
+    :class:`~game_market.telemetry.CrawlTelemetry`, every request's latency,
+    status and bytes are recorded along with retries and cache hits.
+    """
+
+    def __init__(self, key: str, base: str = RAWG_BASE, timeout=HTTP_TIMEOUT,
+                 pool_maxsize: int = POOL_MAXSIZE, cache=None, limiter=None,
+                 retries: int = RETRY_MAX, lake=None, telemetry=None):
+        self.key = key
+        self.telemetry = telemetry
+        self.cache = cache
+        self.lake = lake
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.retries = retries
+        self.base = base.rstrip("/")
+        self.api_root = self.base.rsplit("/", 1)[0]
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip", "Accept": "application/json"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._adapter = adapter
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retried = 0
+        self.bytes_wire = 0
+        self.bytes_body = 0
+
+    def get(self, url: str, params=None, timeout=None) -> requests.Response:
+        params = dict(params or {})
+        params.setdefault("key", self.key)
+        self.limiter.acquire()
+        t0 = time.perf_counter()
+        try:
+            r = self.session.get(url, params=params, timeout=timeout or self.timeout)
+            body = r.content
+        except requests.RequestException:
+            if self.telemetry is not None:
+                self.telemetry.record(url, "error", time.perf_counter() - t0)
+            raise
+        wire = r.raw.tell() or len(body)
+        with self._lock:
+            self.requests += 1
+            self.bytes_wire += wire
+            self.bytes_body += len(body)
+        if self.telemetry is not None:
+            self.telemetry.record(url, r.status_code, time.perf_counter() - t0, wire, len(body))
+        return r
+
+    def get_json(self, url: str, params=None, timeout=None) -> dict:
+        if self.cache is not None:
+            body = self.cache.get(url, params)
+            if body is not None:
+                if self.telemetry is not None:
+                    self.telemetry.cache_hit(url)
+                return body
+        for attempt in range(self.retries + 1):
+            wait = None
+            try:
+                r = self.get(url, params=params, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+                self.limiter.on_throttle(factor=RATE_DECREASE_ERROR)
+            else:
+                if r.status_code not in RETRY_STATUS:
+                    r.raise_for_status()
+                    self.limiter.on_success()
+                    break
+                if attempt == self.retries:
+                    r.raise_for_status()
+                wait = retry_after_seconds(r.headers.get("Retry-After"))
+                if r.status_code in THROTTLE_STATUS or wait is not None:
+                    self.limiter.on_throttle(wait)
+                else:
+                    self.limiter.on_throttle(factor=RATE_DECREASE_ERROR)
+            with self._lock:
+                self.retried += 1
+            if self.telemetry is not None:
+                self.telemetry.retry(url)
+            time.sleep(wait if wait is not None else backoff_delay(attempt))
+        body = r.json()
+        if self.cache is not None:
+            self.cache.put(url, params, body)
+        if self.lake is not None:
+            self.lake.archive(url, body)
+        return body
+
+    def list_games(self, **params) -> dict:
+        """``GET /api/games`` (ordering, page_size, page, ...)."""
+        return self.get_json(self.base, params=params)
+
+    def game(self, rawg_id: int) -> dict:
+        """``GET /api/games/{id}``."""
+        return self.get_json(f"{self.base}/{rawg_id}")
+
+    def entity(self, kind: str, entity_id: int) -> dict:
+        """``GET /api/{kind}/{id}`` for ``kind`` in ``developers`` / ``publishers``."""
+        return self.get_json(f"{self.api_root}/{kind}/{entity_id}")
+
+    def stats(self) -> dict:
+        pools = self._adapter.poolmanager.pools
+        pools = [pools[k] for k in pools.keys()]
+        connections = sum(p.num_connections for p in pools)
+        stats = {
+            "requests": self.requests,
+            "retried": self.retried,
+            "rate": round(self.limiter.rate, 2),
+            "connections": connections,
+            "reused": max(self.requests - connections, 0),
+            "bytes_wire": self.bytes_wire,
+            "bytes_body": self.bytes_body,
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    def close(self) -> None:
+        self.session.close()
+        if self.lake is not None:
+            self.lake.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
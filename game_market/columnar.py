@@ -0,0 +1,147 @@
+"""Streaming ingestion of list rows into typed column buffers flushed to disk in chunks."""
+
+import glob
+import json
+import os
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from .config import CHUNK_ROWS, COLUMNAR_DIR
+
+# Sayısal sütunlar ve tipleri; eksik değer -1 (released için 0) ile tutulur
+INT_COLUMNS = {
+    "rawg_id": np.int64,
+    "metacritic_x": np.int16,
+    "ratings_count": np.int32,
+    "added": np.int32,
+    "released": np.int32,   # YYYYMMDD
+}
+STRING_COLUMNS = ("name",)
+LIST_COLUMNS_CODED = ("platforms",)
+
+
+def released_to_int(s) -> int:
+    """``"1998-11-21"`` → ``19981121``; anything else → 0."""
+    if isinstance(s, str) and len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return int(s[:4] + s[5:7] + s[8:])
+        except ValueError:
+            pass
+    return 0
+
+
+class ColumnarSink:
+    """Preallocated column buffers for ``chunk_rows`` games at a time.
+
+    :meth:`append` writes one list row straight into typed numpy buffers.
+    Multi-value ``platforms`` becomes dictionary codes plus an offsets array
+    (Arrow-style list layout), so no per-game Python objects are kept. When a
+    chunk is full it is written to ``out_dir/chunk_NNNNN.npz`` and the
+    buffers are reused, so peak memory depends on ``chunk_rows``, not on the
+    crawl size. Duplicate ``rawg_id`` values are skipped.
+    """
+
+    def __init__(self, out_dir: str = COLUMNAR_DIR, chunk_rows: int = CHUNK_ROWS):
+        self.out_dir = out_dir
+        self.chunk_rows = chunk_rows
+        os.makedirs(out_dir, exist_ok=True)
+        self.codes = {}         # platform adı → kod
+        self.seen = set()
+        self.chunks = 0
+        self.rows = 0
+        self._ints = {c: np.empty(chunk_rows, dtype=t) for c, t in INT_COLUMNS.items()}
+        self._reset()
+
+    def _reset(self) -> None:
+        self.n = 0
+        self._str = {c: (bytearray(), array("q", [0])) for c in STRING_COLUMNS}
+        self._lists = {c: (array("i"), array("q", [0])) for c in LIST_COLUMNS_CODED}
+
+    def append(self, row: dict) -> None:
+        rid = row.get("rawg_id")
+        if rid is None or rid in self.seen:
+            return
+        self.seen.add(rid)
+        i = self.n
+        for c in INT_COLUMNS:
+            v = row.get(c)
+            if c == "released":
+                v = released_to_int(v)
+            self._ints[c][i] = -1 if v is None else v
+        for c in STRING_COLUMNS:
+            buf, offsets = self._str[c]
+            buf += (row.get(c) or "").encode("utf-8")
+            offsets.append(len(buf))
+        for c in LIST_COLUMNS_CODED:
+            values, offsets = self._lists[c]
+            for name in (p.strip() for p in (row.get(c) or "").split(",")):
+                if name:
+                    values.append(self.codes.setdefault(name, len(self.codes)))
+            offsets.append(len(values))
+        self.n += 1
+        self.rows += 1
+        if self.n == self.chunk_rows:
+            self.flush()
+
+    def extend(self, rows) -> None:
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        if not self.n:
+            return
+        arrays = {c: self._ints[c][:self.n] for c in INT_COLUMNS}
+        for c, (buf, offsets) in self._str.items():
+            arrays[f"{c}.data"] = np.frombuffer(bytes(buf), dtype=np.uint8)
+            arrays[f"{c}.offsets"] = np.frombuffer(offsets, dtype=np.int64)
+        for c, (values, offsets) in self._lists.items():
+            arrays[f"{c}.values"] = np.frombuffer(values, dtype=np.int32)
+            arrays[f"{c}.offsets"] = np.frombuffer(offsets, dtype=np.int64)
+        np.savez(os.path.join(self.out_dir, f"chunk_{self.chunks:05d}.npz"), **arrays)
+        self.chunks += 1
+        self._reset()
+
+    def close(self) -> None:
+        self.flush()
+        with open(os.path.join(self.out_dir, "dictionaries.json"), "w", encoding="utf-8") as fh:
+            json.dump({"platforms": sorted(self.codes, key=self.codes.get)}, fh, ensure_ascii=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_chunks(out_dir: str = COLUMNAR_DIR):
+    """Yield each chunk as a dict of numpy arrays (as written by :class:`ColumnarSink`)."""
+    for path in sorted(glob.glob(os.path.join(out_dir, "chunk_*.npz"))):
+        with np.load(path) as z:
+            yield {k: z[k] for k in z.files}
+
+
+def read_columnar(out_dir: str = COLUMNAR_DIR) -> pd.DataFrame:
+    """Rebuild the list table (``LIST_COLUMNS`` contract) from the chunks."""
+    with open(os.path.join(out_dir, "dictionaries.json"), encoding="utf-8") as fh:
+        platforms = np.asarray(json.load(fh)["platforms"] or [""], dtype=object)
+    frames = []
+    for ch in iter_chunks(out_dir):
+        data, off = ch["name.data"].tobytes(), ch["name.offsets"]
+        names = [data[a:b].decode("utf-8") for a, b in zip(off[:-1], off[1:])]
+        vals, poff = ch["platforms.values"], ch["platforms.offsets"]
+        plats = [", ".join(platforms[vals[a:b]]) for a, b in zip(poff[:-1], poff[1:])]
+        rel = ch["released"]
+        released = pd.to_datetime(pd.Series(rel).where(rel > 0).astype("Int64").astype("string"),
+                                  format="%Y%m%d", errors="coerce").dt.strftime("%Y-%m-%d")
+        frames.append(pd.DataFrame({
+            "rawg_id": ch["rawg_id"],
+            "name": names,
+            "released": released,
+            "metacritic_x": pd.Series(ch["metacritic_x"]).where(ch["metacritic_x"] >= 0).astype("Int16"),
+            "ratings_count": pd.Series(ch["ratings_count"]).where(ch["ratings_count"] >= 0).astype("Int32"),
+            "added": pd.Series(ch["added"]).where(ch["added"] >= 0).astype("Int32"),
+            "platforms": plats,
+        }))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,111 @@
+"""Crawl settings shared by the notebooks and the ``game_market`` modules."""
+
+RAWG_BASE = "https://api.rawg.io/api/games"
+
+TARGET = 5000          # hedef oyun sayısı
+PAGE_SIZE = 40
+ORDERING = "-metacritic"
+
+# Uyarlanabilir hız sınırı (istek/sn): sağlıklı yanıtlar geldikçe saniyede RATE_STEP kadar artar,
+# 429/503'te RATE_DECREASE_THROTTLE, diğer 5xx/bağlantı hatalarında RATE_DECREASE_ERROR
+# ile çarpılır; RATE_DECREASE_WINDOW (sn) içinde en fazla bir kez düşürülür (aynı anda uçuştaki
+# isteklerin hatası tek olay sayılır); Retry-After başlığına uyulur
+RATE_INITIAL = 4.0
+RATE_MIN = 1.0
+RATE_MAX = 20.0
+RATE_STEP = 2.0                 # istek/sn, sağlıklı geçen her saniye için
+RATE_DECREASE_THROTTLE = 0.5
+RATE_DECREASE_ERROR = 0.8
+RATE_DECREASE_WINDOW = 1.0
+
+# Yeniden deneme: 429/5xx ve bağlantı hatalarında jitter'lı üstel bekleme
+RETRY_STATUS = (429, 500, 502, 503, 504)
+THROTTLE_STATUS = (429, 503)
+RETRY_MAX = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+# Detay zenginleştirme: aynı anda açık istek sayısı
+DETAIL_WORKERS = 8
+
+# Paralel liste çekimi: aynı anda çekilen sayfa sayısı
+LIST_WORKERS = 4
+
+# HTTP oturumu: (bağlantı, okuma) timeout ve host başına açık bağlantı sınırı
+HTTP_TIMEOUT = (5, 30)
+POOL_MAXSIZE = DETAIL_WORKERS
+
+# Kaldığı yerden devam: ilerleme günlüğü ve kaç kayıtta bir fsync yapılacağı
+JOURNAL_PATH = "data/crawl_journal.jsonl"
+JOURNAL_FSYNC_EVERY = 50
+
+# Yanıt önbelleği: uç nokta başına TTL (sn) ve disk sınırı (byte)
+CACHE_DIR = "data/http_cache"
+CACHE_TTL = {"list": 24 * 3600, "detail": 7 * 24 * 3600}
+CACHE_MAX_BYTES = 500 * 1024 ** 2
+
+# Parçalı (shard) tam katalog taraması: metacritic bantları × çıkış yılı pencereleri
+SHARD_SCORE_BANDS = [(95, 100), (90, 94), (85, 89), (80, 84), (75, 79), (70, 74), (60, 69), (1, 59)]
+SHARD_FIRST_YEAR = 1970
+SHARD_YEARS = 5
+SHARD_PROCESSES = 4
+SHARD_DIR = "data/shards"
+
+# Dead-letter kuyruğu: ana taramadan sonra düşük öncelikli ikinci deneme
+DLQ_PATH = "data/dead_letter.jsonl"
+DLQ_WORKERS = 2
+DLQ_MAX_ATTEMPTS = 3
+DLQ_BACKOFF_BASE = 2.0
+
+# Öncelikli detay taraması: bu metacritic ve üzeri önce çekilir
+PRIORITY_THRESH = 84
+
+# Akışlı sütunsal liste kaydı: parça (chunk) başına satır sayısı ve çıktı klasörü
+COLUMNAR_DIR = "data/list_columns"
+CHUNK_ROWS = 50_000
+
+# Ham yanıt arşivi (lake): sıkıştırılmış, sadece eklenen segment dosyaları
+LAKE_DIR = "data/lake"
+LAKE_CODEC = "gzip"            # "gzip" veya "lzma" (ikisi de standart kütüphane)
+LAKE_SEGMENT_BYTES = 64 * 1024 ** 2
+LAKE_FLUSH_RECORDS = 100      # bu kadar kayıtta bir tam sıkıştırılmış blok diske yazılır
+LAKE_PROCESSES = 4
+
+# Artımlı yenileme: anlık görüntü (snapshot) klasörü
+SNAPSHOT_DIR = "data/snapshots"
+
+# Tarama telemetrisi: gecikme histogramı kova sınırları (ms), hız penceresi (sn), rapor dosyası
+TELEMETRY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+TELEMETRY_WINDOW = 10.0
+TELEMETRY_REPORT_PATH = "data/crawl_report.json"
+
+# Sütunsal (Parquet) veri kümesi: satır grubu boyu (filtre itmesi bu birimde atlar) ve sıkıştırma
+PARQUET_ROW_GROUP_ROWS = 1024
+PARQUET_COMPRESSION = "zstd"
+
+# Normalize SQLite veritabanı (games + entity + köprü tabloları)
+SQLITE_PATH = "data/rawg_games.sqlite"
+
+# Bellek eşlemeli (mmap) sayısal sütun önbelleği: kaynak dosyanın özetine (sha256) göre klasör
+MMAP_DIR = "data/mmap_cache"
+
+# Varlık sözlüğü: isim → tamsayı kimlik (alan başına), veri kümesiyle birlikte kaydedilir.
+# Takma ad tablosu büyük/küçük harf ve boşluk farkı gözetmeden eşleşir; "NAMCO" / "Namco" gibi
+# sadece yazımı farklı isimler tablo olmadan da birleşir
+ENTITY_VOCAB_PATH = "data/entity_vocab.json"
+ENTITY_ALIASES = {
+    "stores": {
+        "Xbox 360 Store": "Xbox Store",
+        "Xbox One Store": "Xbox Store",
+        "Xbox Series S/X Store": "Xbox Store",
+        "PlayStation 3 Store": "PlayStation Store",
+        "PlayStation 4 Store": "PlayStation Store",
+        "PlayStation 5 Store": "PlayStation Store",
+    },
+    "developers": {
+        "Bandai Namco Entertainment America": "Bandai Namco Entertainment",
+    },
+    "publishers": {
+        "Bandai Namco Entertainment America": "Bandai Namco Entertainment",
+    },
+}
@@ -0,0 +1,210 @@
+"""Normalized SQLite store: ``games``, one table per entity kind and a bridge table for each."""
+
+import os
+import sqlite3
+
+import pandas as pd
+
+from .config import PRIORITY_THRESH, SQLITE_PATH
+from .dataset import ENTITY_FIELDS, entity_lists, split_names
+from .dates import parse_dates
+
+KINDS = ["genres", "developers", "publishers", "stores", "platforms"]
+
+_GAMES = """
+CREATE TABLE games (
+    rawg_id INTEGER PRIMARY KEY,
+    name TEXT,
+    released TEXT,
+    release_year INTEGER,
+    release_month INTEGER,
+    metacritic INTEGER,
+    ratings_count INTEGER,
+    added INTEGER
+)"""
+
+# Köprü tablosunda metacritic / ratings_count / added de tutulur → sayım ve medyanlar
+# games tablosuna dönmeden, sadece indeksten okunur (covering index)
+_ENTITY = """
+CREATE TABLE {kind} (entity_id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE game_{kind} (
+    rawg_id INTEGER NOT NULL REFERENCES games(rawg_id),
+    entity_id INTEGER NOT NULL REFERENCES {kind}(entity_id),
+    metacritic INTEGER,
+    ratings_count INTEGER,
+    added INTEGER,
+    PRIMARY KEY (rawg_id, entity_id)
+) WITHOUT ROWID;
+CREATE TABLE {kind}_scores (
+    entity_id INTEGER NOT NULL,
+    metacritic INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (entity_id, metacritic)
+) WITHOUT ROWID;
+CREATE TABLE {kind}_medians (
+    entity_id INTEGER PRIMARY KEY,
+    n INTEGER NOT NULL,
+    median_metacritic REAL,
+    median_ratings_count REAL,
+    median_added REAL
+)"""
+
+# Skor histogramı (entity × metacritic → oyun sayısı): en fazla ~100 satır/entity,
+# sayım ve 84+ oranları köprü tablosunu taramadan buradan okunur
+_SCORES = """
+INSERT INTO {kind}_scores
+SELECT entity_id, metacritic, COUNT(*) FROM game_{kind} WHERE metacritic IS NOT NULL GROUP BY 1, 2"""
+
+_INDEXES = """
+CREATE INDEX ix_games_year ON games(release_year, metacritic);
+""" + "".join(f"""
+CREATE INDEX ix_game_{k}_metacritic ON game_{k}(entity_id, metacritic);
+CREATE INDEX ix_game_{k}_ratings ON game_{k}(entity_id, ratings_count);
+CREATE INDEX ix_game_{k}_added ON game_{k}(entity_id, added);
+""" for k in KINDS)
+
+
+MEDIAN_COLUMNS = ("metacritic", "ratings_count", "added")
+
+
+def _int(v):
+    return None if pd.isna(v) else int(v)
+
+
+def _medians(links: list):
+    """``(entity_id, n, median_<col>...)`` rows from bridge rows; one pandas groupby at build time."""
+    df = pd.DataFrame(links, columns=["rawg_id", "entity_id", *MEDIAN_COLUMNS]).astype("float64")
+    agg = df.groupby("entity_id").agg(n=("rawg_id", "size"), **{c: (c, "median") for c in MEDIAN_COLUMNS})
+    agg = agg.astype(object).where(agg.notna(), None)
+    return [(int(eid), int(n), *rest) for eid, (n, *rest) in zip(agg.index, agg.itertuples(index=False))]
+
+
+def build_database(df: pd.DataFrame, path: str = SQLITE_PATH, game_entities: pd.DataFrame = None,
+                   entities: pd.DataFrame = None) -> str:
+    """Write ``df_final`` to a fresh SQLite file at ``path``.
+
+    Comma-joined list columns become rows in ``game_<kind>`` pointing at
+    interned names in ``<kind>``; ``<kind>_scores`` holds the per-entity
+    metacritic histogram the count queries read, and ``<kind>_medians`` the
+    per-entity game count and medians. With the entity bridge table and profiles,
+    developers/publishers use those instead (see
+    :func:`~game_market.dataset.to_table`). Indexes are built after the bulk
+    insert, then ``ANALYZE`` runs so the planner picks them.
+    """
+    released = parse_dates(df["released"])[0]
+    ids = pd.to_numeric(df["rawg_id"]).astype("int64")
+    games = [(int(rid), name if isinstance(name, str) else None,
+              None if pd.isna(r) else r.strftime("%Y-%m-%d"),
+              None if pd.isna(r) else r.year, None if pd.isna(r) else r.month,
+              _int(mc), _int(rc), _int(ad))
+             for rid, name, r, mc, rc, ad in zip(ids, df["name"], released, df["metacritic_x"],
+                                                 df["ratings_count"], df["added"])]
+    facts = {g[0]: g[5:] for g in games}
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    con = sqlite3.connect(path)
+    try:
+        con.execute("PRAGMA journal_mode=OFF")
+        con.execute("PRAGMA synchronous=OFF")
+        tables = (["games"] + KINDS + [f"game_{k}" for k in KINDS] + [f"{k}_scores" for k in KINDS]
+                  + [f"{k}_medians" for k in KINDS])
+        con.executescript("".join(f"DROP TABLE IF EXISTS {t};" for t in tables))
+        with con:
+            con.execute(_GAMES)
+            con.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?)", games)
+            for kind in KINDS:
+                con.executescript(_ENTITY.format(kind=kind))
+                lists = [split_names(s) for s in df[kind]] if kind in df.columns else [None] * len(df)
+                if game_entities is not None and entities is not None and kind in ENTITY_FIELDS:
+                    exact = entity_lists(game_entities, entities, ENTITY_FIELDS[kind])
+                    lists = [exact.get(int(rid), lst) for rid, lst in zip(ids, lists)]
+                codes = {}
+                links = []
+                for rid, names in zip(ids, lists):
+                    for name in names or ():
+                        eid = codes.setdefault(name, len(codes) + 1)
+                        links.append((int(rid), eid) + facts[int(rid)])
+                con.executemany(f"INSERT INTO {kind} VALUES (?, ?)", ((i, n) for n, i in codes.items()))
+                con.executemany(f"INSERT OR IGNORE INTO game_{kind} VALUES (?, ?, ?, ?, ?)", links)
+                links = list({link[:2]: link for link in links}.values())     # köprüdeki gibi (oyun, entity) tekil
+                con.executemany(f"INSERT INTO {kind}_medians VALUES (?, ?, ?, ?, ?)", _medians(links))
+            con.executescript(_INDEXES)
+            for kind in KINDS:
+                con.execute(_SCORES.format(kind=kind))
+        con.execute("ANALYZE")
+    finally:
+        con.close()
+    return path
+
+
+def connect(path: str = SQLITE_PATH) -> sqlite3.Connection:
+    """Read-only connection to a :func:`build_database` file."""
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+
+
+def _kind(kind: str) -> str:
+    if kind not in KINDS:
+        raise ValueError(f"unknown kind: {kind}")
+    return kind
+
+
+def _name_expr(con, kind: str, exclude, mapping) -> tuple:
+    """SQL for the (optionally aliased) entity name, plus a WHERE clause for ``exclude``."""
+    name = "e.name"
+    join = ""
+    if mapping:
+        con.execute("CREATE TEMP TABLE IF NOT EXISTS alias (name TEXT PRIMARY KEY, canonical TEXT NOT NULL)")
+        con.execute("DELETE FROM alias")
+        con.executemany("INSERT INTO alias VALUES (?, ?)", mapping.items())
+        join = " LEFT JOIN alias a ON a.name = e.name"
+        name = "COALESCE(a.canonical, e.name)"
+    where = ""
+    params = list(exclude or ())
+    if params:
+        where = f" WHERE e.name NOT IN ({', '.join('?' * len(params))})"
+    return name, join, where, params
+
+
+def entity_stats(con, kind: str, thresh: int = PRIORITY_THRESH, exclude=(), mapping=None) -> pd.DataFrame:
+    """Per-entity ``n_total``, ``n_ge84`` (metacritic ≥ ``thresh``) and ``rate_ge84`` (%), most games first.
+
+    Only games with a metacritic score count, as in the section 4–7 cells.
+    ``mapping`` folds names together (e.g. ``store_mapping``); like the
+    ``Counter`` it replaces, a game listed under two folded names counts twice.
+    """
+    kind = _kind(kind)
+    name, join, where, params = _name_expr(con, kind, exclude, mapping)
+    sql = f"""
+        SELECT {name} AS name, SUM(s.n) AS n_total, SUM(s.n * (s.metacritic >= ?)) AS n_ge84
+        FROM {kind}_scores s JOIN {kind} e ON e.entity_id = s.entity_id{join}{where}
+        GROUP BY 1 ORDER BY n_total DESC, name"""
+    df = pd.read_sql_query(sql, con, params=[thresh] + params)
+    df["rate_ge84"] = (df["n_ge84"] / df["n_total"] * 100).round(1)
+    return df
+
+
+def entity_medians(con, kind: str, columns=("ratings_count", "added"), exclude=()) -> pd.DataFrame:
+    """Per-entity game count ``n`` and ``median_<column>`` (missing values ignored, 0 when none).
+
+    Medians are computed once by :func:`build_database` into
+    ``<kind>_medians``, so this is a single primary-key join.
+    """
+    kind = _kind(kind)
+    for col in columns:
+        if col not in MEDIAN_COLUMNS:
+            raise ValueError(f"unknown column: {col}")
+    _, _, where, params = _name_expr(con, kind, exclude, None)
+    cols = "".join(f", COALESCE(m.median_{c}, 0) AS median_{c}" for c in columns)
+    return pd.read_sql_query(
+        f"SELECT e.name AS name, COALESCE(m.n, 0) AS n{cols} "
+        f"FROM {kind} e LEFT JOIN {kind}_medians m ON m.entity_id = e.entity_id{where} ORDER BY e.entity_id",
+        con, params=params)
+
+
+def year_stats(con, thresh: int = PRIORITY_THRESH) -> pd.DataFrame:
+    """Per release year: games, average metacritic and games at ≥ ``thresh`` (section 3)."""
+    return pd.read_sql_query("""
+        SELECT release_year AS year, COUNT(*) AS n_games, AVG(metacritic) AS avg_metacritic,
+               SUM(metacritic >= ?) AS n_ge84
+        FROM games WHERE release_year IS NOT NULL GROUP BY release_year ORDER BY release_year""",
+                             con, params=[thresh])
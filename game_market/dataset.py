@@ -0,0 +1,126 @@
+"""Parquet storage for ``df_final``: real list columns, dictionary-encoded names, typed numerics.
+
+Needs ``pyarrow`` (optional; the CSV export works without it).
+"""
+
+import pandas as pd
+
+from .config import PARQUET_COMPRESSION, PARQUET_ROW_GROUP_ROWS
+from .dates import parse_dates
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:     # pragma: no cover - isteğe bağlı bağımlılık
+    pa = pq = None
+
+HAS_PYARROW = pa is not None
+
+LIST_FIELDS = ["platforms", "developers", "publishers", "genres", "stores"]
+# Bu alanlar köprü tablosundan (rawg_id ↔ entity_id) birebir kurulabilir → virgüllü isimler bozulmaz
+ENTITY_FIELDS = {"developers": "developers", "publishers": "publishers"}
+
+
+def _require():
+    if not HAS_PYARROW:
+        raise ImportError("game_market.dataset needs pyarrow (pip install pyarrow)")
+
+
+def _schema():
+    names = pa.list_(pa.dictionary(pa.int32(), pa.string()))
+    return pa.schema([
+        ("rawg_id", pa.int64()),
+        ("name", pa.string()),
+        ("released", pa.date32()),
+        ("metacritic_x", pa.int8()),
+        ("ratings_count", pa.int32()),
+        ("added", pa.int32()),
+        *[(f, names) for f in LIST_FIELDS],
+    ])
+
+
+def split_names(s):
+    """Comma-joined names (``join_names`` output) → list; ``None`` for missing."""
+    if not isinstance(s, str):
+        return None
+    return [x.strip() for x in s.split(",") if x.strip()]
+
+
+def entity_lists(game_entities: pd.DataFrame, entities: pd.DataFrame, kind: str) -> dict:
+    """``rawg_id`` → entity names of ``kind`` from the bridge table, in payload order."""
+    names = entities.loc[entities["kind"] == kind].set_index("entity_id")["name"]
+    links = game_entities.loc[game_entities["kind"] == kind]
+    out = {}
+    for rid, eid in zip(links["rawg_id"], links["entity_id"]):
+        name = names.get(eid)
+        if isinstance(name, str):
+            out.setdefault(int(rid), []).append(name)
+    return out
+
+
+def to_table(df: pd.DataFrame, game_entities: pd.DataFrame = None, entities: pd.DataFrame = None):
+    """``df_final`` → Arrow table with the typed schema.
+
+    List fields come from splitting the joined strings. When the bridge
+    table and entity profiles are given, developers/publishers come from
+    them instead, so names containing commas stay whole.
+    """
+    _require()
+    schema = _schema()
+    cols = {
+        "rawg_id": pd.to_numeric(df["rawg_id"]).astype("int64"),
+        "name": df["name"].astype(object).where(df["name"].notna(), None),
+        "released": parse_dates(df["released"])[0].dt.date,
+    }
+    for c in ("metacritic_x", "ratings_count", "added"):
+        cols[c] = pd.to_numeric(df[c], errors="coerce").astype("Int64")
+    for f in LIST_FIELDS:
+        lists = [split_names(s) for s in df[f]] if f in df.columns else [None] * len(df)
+        if game_entities is not None and entities is not None and f in ENTITY_FIELDS:
+            exact = entity_lists(game_entities, entities, ENTITY_FIELDS[f])
+            lists = [exact.get(int(rid), lst) for rid, lst in zip(cols["rawg_id"], lists)]
+        cols[f] = lists
+    arrays = []
+    for field in schema:
+        values = cols[field.name]
+        if pa.types.is_list(field.type):
+            arr = pa.array(values, type=pa.list_(pa.string()))
+            arr = pa.ListArray.from_arrays(arr.offsets, arr.values.dictionary_encode(), mask=arr.is_null())
+        else:
+            arr = pa.array(values.tolist() if hasattr(values, "tolist") else values, type=field.type,
+                           from_pandas=True)
+        arrays.append(arr)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def write_games(df: pd.DataFrame, path: str, game_entities: pd.DataFrame = None, entities: pd.DataFrame = None,
+                row_group_rows: int = PARQUET_ROW_GROUP_ROWS, compression: str = PARQUET_COMPRESSION) -> str:
+    """Write ``df_final`` as Parquet, sorted by metacritic (desc) so row-group stats prune well."""
+    table = to_table(df, game_entities, entities)
+    table = table.sort_by([("metacritic_x", "descending"), ("rawg_id", "ascending")])
+    pq.write_table(table, path, row_group_size=row_group_rows, compression=compression,
+                   use_dictionary=True, write_statistics=True)
+    return path
+
+
+def read_games(path: str, columns=None, filters=None, joined: bool = False) -> pd.DataFrame:
+    """Load a :func:`write_games` file, reading only ``columns`` and rows matching ``filters``.
+
+    ``filters`` uses the pyarrow form, e.g. ``[("metacritic_x", ">=", 84)]``
+    or ``[("released", ">=", datetime.date(2015, 1, 1))]``. Row groups whose
+    statistics rule the predicate out are skipped without being decoded.
+    List fields come back as lists of names, or as comma-joined strings (the
+    CSV layout) with ``joined=True``. Names stay categorical-backed until
+    then, so repeated names are stored once.
+    """
+    _require()
+    table = pq.read_table(path, columns=columns, filters=filters,
+                          read_dictionary=[f"{f}.list.element" for f in LIST_FIELDS
+                                           if columns is None or f in columns])
+    df = table.to_pandas()
+    for f in LIST_FIELDS:
+        if f in df.columns:
+            df[f] = [None if v is None else (", ".join(v) if joined else list(v)) for v in df[f]]
+    if "released" in df.columns:
+        df["released"] = pd.to_datetime(df["released"])
+    return df
@@ -0,0 +1,69 @@
+"""Load-time ``released`` parsing: detect the format once per column, parse with a fixed format."""
+
+import pandas as pd
+
+# (ad, strftime biçimi) deneme sırasıyla — RAWG ISO verir, Excel'den geçen CSV'ler M/D/YYYY
+DATE_FORMATS = [
+    ("iso", "%Y-%m-%d"),
+    ("mdy", "%m/%d/%Y"),
+]
+# Proleptik Gregoryen gün sırası (date.toordinal()) = 1970-01-01'den gün + bu fark
+EPOCH_ORDINAL = 719163
+
+
+def parse_dates(s: pd.Series):
+    """Strings → ``datetime64[s]`` Series plus ``{format name: rows parsed}``.
+
+    The whole column is parsed with the first fixed format in
+    ``DATE_FORMATS`` (one vectorized ``pd.to_datetime(format=...)`` call).
+    Only values that did not fit are retried with the next format, so a
+    single-format column costs exactly one parse, and a mixed ISO /
+    ``M/D/YYYY`` column costs one parse per format present. Values that fit
+    no format, or are impossible dates, become ``NaT`` (``"unparsed"``).
+    Nothing is inferred value by value, so, unlike a format-inferring
+    ``to_datetime``, the format of the first row cannot turn the rest of a
+    mixed column into ``NaT``.
+    """
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.astype("datetime64[s]"), {"datetime": int(s.notna().sum())}
+    text = s.astype("string").str.strip()
+    todo = (text.notna() & (text != "")).to_numpy(dtype=bool)
+    out = None
+    counts = {}
+    for name, fmt in DATE_FORMATS:
+        if not todo.any():
+            break
+        parsed = pd.to_datetime(text if out is None else text[todo], format=fmt, errors="coerce")
+        parsed = parsed.astype("datetime64[s]")
+        if out is None:
+            out = parsed
+            ok = parsed.notna().to_numpy(dtype=bool)
+        else:
+            ok = parsed.notna().to_numpy(dtype=bool)
+            out.loc[parsed.index[ok]] = parsed[ok]
+            ok = out.notna().to_numpy(dtype=bool) & todo
+        n = int(ok.sum())
+        if n:
+            counts[name] = n
+        todo = todo & ~ok
+    if out is None:
+        out = pd.Series(pd.NaT, index=s.index, dtype="datetime64[s]")
+    counts["unparsed"] = int(todo.sum())
+    return out, counts
+
+
+def date_parts(released: pd.Series) -> pd.DataFrame:
+    """``release_year`` (Int16), ``release_month`` (Int8) and ``release_ordinal`` (Int32, ``date.toordinal()``)."""
+    ok = released.notna()
+    days = released.to_numpy().astype("datetime64[D]").astype("int64") + EPOCH_ORDINAL
+    return pd.DataFrame({
+        "release_year": released.dt.year.astype("Int16"),
+        "release_month": released.dt.month.astype("Int8"),
+        "release_ordinal": pd.Series(days, index=released.index).where(ok).astype("Int32"),
+    }, index=released.index)
+
+
+def add_release_parts(df: pd.DataFrame, column: str = "released"):
+    """Parse ``column`` once and add the :func:`date_parts` columns → ``(df, format counts)``."""
+    released, counts = parse_dates(df[column])
+    return df.assign(**{column: released}, **date_parts(released)), counts
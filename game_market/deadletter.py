@@ -0,0 +1,145 @@
+"""Dead-letter queue for failed detail fetches and the deferred retry pass."""
+
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .config import DLQ_BACKOFF_BASE, DLQ_MAX_ATTEMPTS, DLQ_PATH, DLQ_WORKERS
+from .details import fetch_game_details
+from .listing import LIST_SOURCED
+from .ratelimit import backoff_delay
+
+
+def describe_error(e: Exception) -> dict:
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    # hata mesajındaki URL API anahtarını içerir; diske yazmadan önce gizle
+    message = re.sub(r"key=[^&\s]+", "key=***", str(e))[:200]
+    return {"error": type(e).__name__, "status": status, "message": message}
+
+
+class DeadLetterQueue:
+    """Persistent set of detail ids whose fetch failed after all retries.
+
+    Backed by an append-only JSONL file of ``add`` / ``done`` events that is
+    replayed on open. Each entry keeps the last error class, HTTP status and
+    how many crawl passes have failed for it (``attempts``).
+    """
+
+    def __init__(self, path: str = DLQ_PATH):
+        self.path = path
+        self.entries = {}   # rawg_id → {"rawg_id", "error", "status", "message", "attempts", "ts"}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    if rec.get("op") == "add":
+                        self.entries[rec["rawg_id"]] = {k: v for k, v in rec.items() if k != "op"}
+                    elif rec.get("op") == "done":
+                        self.entries.pop(rec["rawg_id"], None)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fh = open(path, "a", encoding="utf-8")
+
+    def _write(self, rec: dict) -> None:
+        self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._fh.flush()
+
+    def add(self, rawg_id: int, e: Exception) -> None:
+        rawg_id = int(rawg_id)
+        with self._lock:
+            attempts = self.entries.get(rawg_id, {}).get("attempts", 0) + 1
+            entry = dict(rawg_id=rawg_id, attempts=attempts, ts=time.time(), **describe_error(e))
+            self.entries[rawg_id] = entry
+            self._write(dict(op="add", **entry))
+
+    def done(self, rawg_id: int) -> None:
+        rawg_id = int(rawg_id)
+        with self._lock:
+            if self.entries.pop(rawg_id, None) is not None:
+                self._write({"op": "done", "rawg_id": rawg_id})
+
+    def ids(self) -> list:
+        return sorted(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+def drain_dead_letters(dlq: DeadLetterQueue, client, workers: int = DLQ_WORKERS,
+                       max_attempts: int = DLQ_MAX_ATTEMPTS, journal=None, on_payload=None,
+                       scheduler=None) -> dict:
+    """Low-priority retry pass over the queue, run after the main crawl.
+
+    Each id waits a jittered backoff that grows with its ``attempts`` before
+    its call, and only ``workers`` ids run at once, so the pass stays well
+    below the main crawl's load. Ids at ``max_attempts`` are left alone;
+    404s are permanent and are not retried either. Returns
+    ``{rawg_id: detail row}`` for recovered ids; the rest stay queued.
+    """
+    todo = [e for e in dlq.entries.values()
+            if e["attempts"] < max_attempts and e.get("status") != 404]
+    print(f">> Dead-letter: {len(todo)} tekrar denenecek, {len(dlq) - len(todo)} beklemede")
+
+    def retry(entry):
+        time.sleep(backoff_delay(entry["attempts"], base=DLQ_BACKOFF_BASE))
+        return fetch_game_details(entry["rawg_id"], client, on_payload)
+
+    recovered = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(retry, e): e["rawg_id"] for e in todo}
+        try:
+            for fut in as_completed(futures):
+                rid = futures[fut]
+                try:
+                    row = fut.result()
+                except Exception as e:     # CacheMiss (çevrimdışı önbellek) dahil; geçiş yarıda kesilmesin
+                    dlq.add(rid, e)
+                    continue
+                recovered[rid] = row
+                dlq.done(rid)
+                if scheduler is not None:
+                    scheduler.mark_done(rid)
+                if journal is not None:
+                    journal.add_detail(row)
+        except BaseException:
+            # Ctrl-C / hata: kuyrukta bekleyen çağrılar iptal edilir, sadece uçuştakiler (≤ workers) biter
+            pool.shutdown(cancel_futures=True)
+            raise
+    print(f">> Dead-letter: {len(recovered)} kurtarıldı, {len(dlq)} hâlâ başarısız")
+    return recovered
+
+
+def apply_recovered(detail_rows: list, recovered: dict) -> list:
+    """Overlay recovered detail rows, keeping values already sourced from the list.
+
+    Detail-only fields (developers, publishers) take the recovered value.
+    A ``LIST_SOURCED`` field (genres, stores) keeps the list value and is
+    only filled in where the row has none.
+    """
+    out = []
+    for row in detail_rows:
+        rec = recovered.get(row["rawg_id"])
+        if rec:
+            row = dict(row, **{k: v for k, v in rec.items()
+                               if v is not None and k in row and (k not in LIST_SOURCED or row[k] is None)})
+        out.append(row)
+    return out
+
+
+def mark_fetch_failures(df, dlq: DeadLetterQueue, column: str = "detail_status"):
+    """Add ``column``: ``"fetch_failed"`` for ids still queued, ``"ok"`` otherwise.
+
+    An empty developers/publishers value is then a real RAWG null only where
+    the status is ``"ok"``.
+    """
+    failed = set(dlq.ids())
+    return df.assign(**{column: df["rawg_id"].map(lambda rid: "fetch_failed" if rid in failed else "ok")})
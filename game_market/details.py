@@ -0,0 +1,106 @@
+"""Detail enrichment: ``GET /api/games/{id}`` for developers, publishers, genres, stores."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .config import DETAIL_WORKERS
+
+DETAIL_COLUMNS = ["rawg_id", "developers", "publishers", "genres", "stores"]
+
+
+def join_names(lst, key="name"):
+    return ", ".join([x.get(key) for x in (lst or []) if isinstance(x, dict) and x.get(key)]) if lst else None
+
+
+def join_store_names(lst):
+    if not lst:
+        return None
+    return ", ".join([(s.get("store") or {}).get("name") for s in lst if (s.get("store") or {}).get("name")])
+
+
+def parse_game_details(d: dict) -> dict:
+    """Detail payload → one row with the ``DETAIL_COLUMNS`` contract."""
+    return {
+        "rawg_id": d.get("id"),
+        "developers": join_names(d.get("developers")),
+        "publishers": join_names(d.get("publishers")),
+        "genres": join_names(d.get("genres")),
+        "stores": join_store_names(d.get("stores"))
+    }
+
+
+def empty_details(rawg_id: int) -> dict:
+    return {"rawg_id": int(rawg_id), "developers": None, "publishers": None, "genres": None, "stores": None}
+
+
+def fetch_game_details(rawg_id: int, client, on_payload=None) -> dict:
+    d = client.game(rawg_id)
+    if on_payload is not None:
+        on_payload(d)
+    return parse_game_details(d)
+
+
+def enrich_details(ids, client, workers: int = DETAIL_WORKERS, progress_every: int = 100,
+                   journal=None, on_payload=None, dead_letters=None, scheduler=None) -> list:
+    """Fetch details for ``ids`` concurrently and return rows in input order.
+
+    At most ``workers`` requests are in flight and all of them draw from the
+    client's rate limiter, which also retries 429/5xx responses. The pool size
+    of ``client`` should be at least ``workers``. A call that still fails after
+    the retries yields an empty row and the crawl continues.
+
+    With a :class:`~game_market.journal.CrawlJournal`, ids that already have
+    a journaled row are not fetched again and each new row is journaled as
+    soon as it arrives.
+
+    ``on_payload`` is called (from worker threads) with every raw detail
+    payload, e.g. :meth:`~game_market.entities.EntityIndex.collect`.
+
+    With a :class:`~game_market.deadletter.DeadLetterQueue`, failed ids are
+    recorded there (error class, status, attempts) for a later retry pass,
+    and ids that succeed are removed from it.
+
+    With a :class:`~game_market.scheduler.CrawlScheduler`, ids are fetched in
+    its value order, not list order. Progress is then printed as coverage per
+    segment.
+    """
+    ids = [int(i) for i in ids]
+    done_rows = journal.details if journal is not None else {}
+
+    out = [done_rows.get(rid) for rid in ids]
+    todo = [i for i, row in enumerate(out) if row is None]
+    if len(todo) < len(ids):
+        print(f">> Günlükten devam: {len(ids) - len(todo)} detay hazır, {len(todo)} kaldı")
+    if scheduler is not None:
+        for i, row in enumerate(out):
+            if row is not None:
+                scheduler.mark_done(ids[i])
+        # havuzun iş kuyruğu FIFO: gönderim sırası = çekim sırası
+        pos = {rid: i for i, rid in enumerate(ids)}
+        todo = [pos[rid] for rid in scheduler.order([ids[i] for i in todo])]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch_game_details, ids[i], client, on_payload): i for i in todo}
+        try:
+            for done, fut in enumerate(as_completed(futures), start=1):
+                i = futures[fut]
+                try:
+                    out[i] = fut.result()
+                    if journal is not None:
+                        journal.add_detail(out[i])
+                    if dead_letters is not None:
+                        dead_letters.done(ids[i])
+                    if scheduler is not None:
+                        scheduler.mark_done(ids[i])
+                except Exception as e:
+                    # hata olursa boş kayıt koyup devam edelim (dead-letter kuyruğuna yazılır)
+                    out[i] = empty_details(ids[i])
+                    if dead_letters is not None:
+                        dead_letters.add(ids[i], e)
+                    print(f"  ! detay hatası (id={ids[i]}): {type(e).__name__} - {e}")
+                if done % progress_every == 0 or done == len(todo):
+                    print(f"  - Detay ilerleme: {done}/{len(todo)}"
+                          + (f"  [{scheduler.progress_line()}]" if scheduler is not None else ""))
+        except BaseException:
+            # Ctrl-C / hata: kuyrukta bekleyen çağrılar iptal edilir, sadece uçuştakiler (≤ workers) biter
+            pool.shutdown(cancel_futures=True)
+            raise
+    return out
@@ -0,0 +1,118 @@
+"""Developer/publisher profiles: fetch each entity once and join games to an entity table."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from .config import DETAIL_WORKERS
+
+ENTITY_KINDS = ("developers", "publishers")
+ENTITY_COLUMNS = ["kind", "entity_id", "name", "slug", "games_count", "image_background"]
+
+
+class EntityIndex:
+    """Distinct developer/publisher ids seen in detail payloads.
+
+    Pass :meth:`collect` as ``on_payload`` to the detail crawl. It records
+    which entities each game references, so later stages work on the
+    distinct entity set instead of repeating per-game requests.
+    """
+
+    def __init__(self):
+        self.links = {}     # rawg_id → [(kind, entity_id), ...]
+        self.names = {}     # (kind, entity_id) → name
+        self._lock = threading.Lock()
+
+    def collect(self, d: dict) -> None:
+        refs = []
+        for kind in ENTITY_KINDS:
+            for e in d.get(kind) or []:
+                if isinstance(e, dict) and e.get("id") is not None:
+                    refs.append((kind, int(e["id"])))
+                    with self._lock:
+                        self.names[(kind, int(e["id"]))] = e.get("name")
+        with self._lock:
+            self.links[int(d["id"])] = refs
+
+    def fill_missing(self, ids, client, skip=(), workers: int = DETAIL_WORKERS) -> int:
+        """Collect refs for ``ids`` the crawl did not see (e.g. rows resumed from a journal).
+
+        Ids in ``skip`` (details that failed for good, see
+        :func:`~game_market.deadletter.mark_fetch_failures`) are not tried
+        again. The rest go through ``client.game`` on a thread pool, like
+        :func:`fetch_entities`; a journaled detail is usually still in the
+        response cache, so those calls stay off the network. Returns how
+        many games were tried.
+        """
+        skip = {int(i) for i in skip}
+        missing = [int(i) for i in ids if int(i) not in self.links and int(i) not in skip]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(client.game, rid): rid for rid in missing}
+            try:
+                for fut in as_completed(futures):
+                    try:
+                        self.collect(fut.result())
+                    except Exception as e:
+                        print(f"  ! detay hatası (id={futures[fut]}): {type(e).__name__} - {e}")
+            except BaseException:
+                # Ctrl-C / hata: kuyrukta bekleyen çağrılar iptal edilir, sadece uçuştakiler (≤ workers) biter
+                pool.shutdown(cancel_futures=True)
+                raise
+        return len(missing)
+
+    def entities(self) -> list:
+        return sorted(self.names)
+
+    def game_entities(self) -> pd.DataFrame:
+        """Bridge table ``rawg_id, kind, entity_id``."""
+        rows = [{"rawg_id": rid, "kind": kind, "entity_id": eid}
+                for rid, refs in self.links.items() for kind, eid in refs]
+        return pd.DataFrame(rows, columns=["rawg_id", "kind", "entity_id"])
+
+
+def parse_entity(kind: str, e: dict) -> dict:
+    return {
+        "kind": kind,
+        "entity_id": e.get("id"),
+        "name": e.get("name"),
+        "slug": e.get("slug"),
+        "games_count": e.get("games_count"),
+        "image_background": e.get("image_background"),
+    }
+
+
+def fetch_entities(index: EntityIndex, client, workers: int = DETAIL_WORKERS, known=None) -> pd.DataFrame:
+    """Entity table with one ``GET /api/{kind}/{id}`` per distinct entity.
+
+    ``known`` is an entity table from an earlier run; entities already in it
+    are not fetched again. A failed call keeps the name seen in the game
+    payloads and leaves the profile fields empty.
+    """
+    have = set()
+    rows = []
+    if known is not None and len(known):
+        rows = known.to_dict("records")
+        have = {(r["kind"], int(r["entity_id"])) for r in rows}
+    todo = [ref for ref in index.entities() if ref not in have]
+    print(f">> Entity profilleri: {len(todo)} çekilecek, {len(have)} hazır")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(client.entity, kind, eid): (kind, eid) for kind, eid in todo}
+        try:
+            for fut in as_completed(futures):
+                kind, eid = futures[fut]
+                try:
+                    row = parse_entity(kind, fut.result())
+                    row["name"] = row["name"] or index.names.get((kind, eid))
+                    rows.append(row)
+                except Exception as e:
+                    rows.append({"kind": kind, "entity_id": eid, "name": index.names.get((kind, eid)),
+                                 "slug": None, "games_count": None, "image_background": None})
+                    print(f"  ! entity hatası ({kind}/{eid}): {type(e).__name__} - {e}")
+        except BaseException:
+            # Ctrl-C / hata: kuyrukta bekleyen çağrılar iptal edilir, sadece uçuştakiler (≤ workers) biter
+            pool.shutdown(cancel_futures=True)
+            raise
+    return (pd.DataFrame(rows, columns=ENTITY_COLUMNS)
+              .sort_values(["kind", "entity_id"])
+              .reset_index(drop=True))
@@ -0,0 +1,49 @@
+"""Vectorized explode of comma-joined entity columns into flat ``(game_idx, entity_id)`` arrays."""
+
+import numpy as np
+import pandas as pd
+
+
+def explode_codes(s: pd.Series, exclude=None, mapping=None, sep: str = ","):
+    """Multi-value column → ``(game_idx, entity_id, names)``.
+
+    Only the distinct joined strings are split in Python (a few thousand
+    genre/store combinations, even for millions of games). Each becomes a
+    run of entity ids in one flat array with offsets, and every game's run
+    is then gathered with ``np.repeat`` arithmetic in numpy, with no
+    per-game Python.
+
+    Names are stripped and empty parts dropped, as ``.split(",")`` +
+    ``.strip()`` did. A name in ``exclude`` (before or after ``mapping``) is
+    skipped. ``mapping`` folds names together (e.g. ``store_mapping``).
+    Repeats within one game are kept, matching the ``Counter`` cells, so
+    two stores folded into one count twice. ``game_idx`` is the row
+    position in ``s``; ``names[entity_id]`` is the entity name.
+    """
+    exclude = set(exclude or ())
+    mapping = mapping or {}
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    vocab = {}
+    values, offsets = [], [0]
+    for joined in uniques:
+        for part in str(joined).split(sep):
+            name = part.strip()
+            if not name or name in exclude:
+                continue
+            name = mapping.get(name, name)
+            if name in exclude:
+                continue
+            values.append(vocab.setdefault(name, len(vocab)))
+        offsets.append(len(values))
+    values = np.asarray(values, dtype=np.int32)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.zeros(len(codes), dtype=np.int64)
+    ok = codes >= 0
+    lengths[ok] = offsets[codes[ok] + 1] - offsets[codes[ok]]
+    game_idx = np.repeat(np.arange(len(codes), dtype=np.int64), lengths)
+    # oyun i'nin j. öğesi: values[offsets[codes[i]] + j]
+    starts = np.repeat(np.where(ok, offsets[np.where(ok, codes, 0)], 0) - (np.cumsum(lengths) - lengths), lengths)
+    entity_id = values[starts + np.arange(len(game_idx))]
+    names = np.asarray(sorted(vocab, key=vocab.get), dtype=object)
+    return game_idx, entity_id, names
+
@@ -0,0 +1,156 @@
+"""Sparse game × entity incidence matrices (CSR): per-entity aggregates as mat-vec products.
+
+``scipy`` is optional: without it the same products run as ``np.bincount``
+over the CSR arrays; only :meth:`Incidence.matrix` and
+:meth:`Incidence.cooccurrence` need it.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .config import PRIORITY_THRESH
+from .explode import explode_codes
+
+try:
+    import scipy.sparse as sp
+except ImportError:     # pragma: no cover - isteğe bağlı bağımlılık
+    sp = None
+
+HAS_SCIPY = sp is not None
+
+
+class Incidence:
+    """CSR incidence of ``n_games`` rows × ``len(names)`` entity columns.
+
+    Game ``i`` links to entities ``indices[indptr[i]:indptr[i + 1]]``. This
+    is the ``values`` / ``offsets`` layout of
+    :class:`~game_market.mmapcache.ColumnCache` and
+    :class:`~game_market.columnar.ColumnarSink`, so a cached dataset
+    version opens as an incidence matrix without copying. A repeated entity
+    in one game is a repeated index, so it counts twice, as the ``Counter``
+    cells did.
+
+    With ``A`` the matrix and ``v`` a per-game vector, ``A.T @ v`` gives
+    per-entity totals (:meth:`totals`). ``n_total`` and ``n_ge84`` are two
+    such products (:meth:`stats`).
+    """
+
+    def __init__(self, indptr, indices, names):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.names = np.asarray(names, dtype=object)
+        self.n_games = len(self.indptr) - 1
+        self._matrix = None
+
+    @classmethod
+    def from_column(cls, s: pd.Series, exclude=None, mapping=None, sep: str = ","):
+        """Build from a comma-joined column (see :func:`~game_market.explode.explode_codes`)."""
+        game_idx, entity_id, names = explode_codes(s, exclude, mapping, sep)
+        indptr = np.zeros(len(s) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(game_idx, minlength=len(s)), out=indptr[1:])
+        return cls(indptr, entity_id, names)
+
+    @classmethod
+    def from_column_cache(cls, cache, field: str):
+        """Zero-copy view of a :class:`~game_market.mmapcache.ColumnCache` list field."""
+        values, offsets = cache.entity_ids(field)
+        return cls(offsets, values, cache.dictionaries[field])
+
+    @property
+    def shape(self):
+        return self.n_games, len(self.names)
+
+    def rows(self) -> np.ndarray:
+        """Row (game) index of every stored link."""
+        return np.repeat(np.arange(self.n_games, dtype=np.int64), np.diff(self.indptr))
+
+    @property
+    def matrix(self):
+        """``scipy.sparse.csr_matrix`` of ones (needs scipy)."""
+        if not HAS_SCIPY:
+            raise ImportError("Incidence.matrix needs scipy (pip install scipy)")
+        if self._matrix is None:
+            data = np.ones(len(self.indices), dtype=np.float64)
+            self._matrix = sp.csr_matrix((data, self.indices, self.indptr), shape=self.shape)
+        return self._matrix
+
+    def fold(self, mapping=None, exclude=None) -> "Incidence":
+        """Same games with entities renamed by ``mapping`` and ``exclude`` dropped (no re-split)."""
+        mapping = mapping or {}
+        exclude = set(exclude or ())
+        vocab, remap = {}, np.full(len(self.names), -1, dtype=np.int64)
+        for i, name in enumerate(self.names):
+            if name in exclude:
+                continue
+            name = mapping.get(name, name)
+            if name not in exclude:
+                remap[i] = vocab.setdefault(name, len(vocab))
+        new = remap[self.indices]
+        keep = new >= 0
+        indptr = np.zeros(self.n_games + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows()[keep], minlength=self.n_games), out=indptr[1:])
+        return Incidence(indptr, new[keep], sorted(vocab, key=vocab.get))
+
+    def totals(self, values=None, mask=None) -> np.ndarray:
+        """``A.T @ (values * mask)``: per-entity sum of a per-game vector (count of games when ``None``).
+
+        Missing values count as 0.
+        """
+        v = np.ones(self.n_games) if values is None else _as_float(values)
+        if mask is not None:
+            v = v * _as_mask(mask)
+        if HAS_SCIPY:
+            return self.matrix.T @ v
+        return np.bincount(self.indices, weights=v[self.rows()], minlength=len(self.names))
+
+    def stats(self, metacritic, thresh: int = PRIORITY_THRESH) -> pd.DataFrame:
+        """``n_total`` / ``n_ge84`` / ``rate_ge84`` per entity over games with a score, sorted by name.
+
+        Same rows, in the same order, as the developer/publisher
+        ``groupby(..., as_index=False)`` it replaces.
+        """
+        score = _as_float(metacritic, fill=np.nan)
+        scored = ~np.isnan(score)
+        n_total = self.totals(mask=scored)
+        n_ge84 = self.totals(mask=scored & (np.nan_to_num(score) >= thresh))
+        used = n_total > 0
+        out = pd.DataFrame({
+            "name": self.names[used],
+            "n_total": n_total[used].astype(np.int64),
+            "n_ge84": n_ge84[used].astype(np.int64),
+        })
+        out["rate_ge84"] = (out["n_ge84"] / out["n_total"] * 100).round(1)
+        return out.sort_values("name").reset_index(drop=True)
+
+    def medians(self, values) -> np.ndarray:
+        """Per-entity median of a per-game vector (missing values ignored; ``nan`` when none)."""
+        v = _as_float(values, fill=np.nan)[self.rows()]
+        ent = self.indices.astype(np.int64)
+        ok = ~np.isnan(v)
+        v, ent = v[ok], ent[ok]
+        order = np.lexsort((v, ent))
+        v, ent = v[order], ent[order]
+        counts = np.bincount(ent, minlength=len(self.names))
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        out = np.full(len(self.names), np.nan)
+        has = counts > 0
+        lo = starts[has] + (counts[has] - 1) // 2
+        hi = starts[has] + counts[has] // 2
+        out[has] = (v[lo] + v[hi]) / 2
+        return out
+
+    def cooccurrence(self, other: "Incidence" = None):
+        """``A.T @ B`` (needs scipy): games shared by each entity pair, e.g. genre × store."""
+        other = self if other is None else other
+        if other.n_games != self.n_games:
+            raise ValueError("incidence matrices cover different games")
+        return (self.matrix.T @ other.matrix).tocsr()
+
+
+def _as_float(values, fill: float = 0.0) -> np.ndarray:
+    return pd.to_numeric(pd.Series(values), errors="coerce").astype("float64").fillna(fill).to_numpy()
+
+
+def _as_mask(mask) -> np.ndarray:
+    return pd.Series(mask).fillna(False).astype(bool).to_numpy()
+
@@ -0,0 +1,105 @@
+"""Append-only JSONL progress journal for resumable crawls."""
+
+import json
+import os
+import threading
+
+from .config import JOURNAL_FSYNC_EVERY
+
+
+class CrawlJournal:
+    """Records every finished list page and detail row as one JSON line.
+
+    Two record kinds are written::
+
+        {"kind": "page", "page": 3, "rows": [...], "next": true, "count": 5123}
+        {"kind": "detail", "row": {"rawg_id": ..., "developers": ...}}
+
+    Lines are flushed immediately and ``fsync``-ed every ``fsync_every``
+    records (and on :meth:`close`), so a crash loses at most one batch. On
+    open the existing file is replayed once; a torn last line from a crash is
+    ignored. Failed detail calls are not journaled, so they are retried on
+    the next run. Once the crawl's output is saved, :meth:`archive` retires
+    the journal so a later run crawls afresh.
+    """
+
+    def __init__(self, path: str, fsync_every: int = JOURNAL_FSYNC_EVERY):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.pages = {}     # page → (rows, has_next)
+        self.details = {}   # rawg_id → detail row
+        self.count = None   # liste yanıtındaki toplam sonuç sayısı
+        self._pending = 0
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self._replay()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fh = open(path, "a", encoding="utf-8")
+
+    def _replay(self) -> None:
+        with open(self.path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if rec.get("kind") == "page":
+                    self.pages[rec["page"]] = (rec["rows"], rec["next"])
+                    if rec.get("count") is not None:
+                        self.count = rec["count"]
+                elif rec.get("kind") == "detail":
+                    self.details[rec["row"]["rawg_id"]] = rec["row"]
+
+    def _write(self, rec: dict) -> None:
+        with self._lock:
+            self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            self._fh.flush()
+            self._pending += 1
+            if self._pending >= self.fsync_every:
+                os.fsync(self._fh.fileno())
+                self._pending = 0
+
+    def add_page(self, page: int, rows: list, has_next: bool, count: int = None) -> None:
+        self.pages[page] = (rows, has_next)
+        if count is not None:
+            self.count = count
+        self._write({"kind": "page", "page": page, "rows": rows, "next": has_next, "count": count})
+
+    def add_detail(self, row: dict) -> None:
+        self.details[row["rawg_id"]] = row
+        self._write({"kind": "detail", "row": row})
+
+    def list_cursor(self):
+        """Rows of pages ``1..k`` (contiguous), the next page to fetch and whether ``next`` ran out."""
+        rows, page, has_next = [], 1, True
+        while page in self.pages:
+            page_rows, has_next = self.pages[page]
+            rows.extend(page_rows)
+            page += 1
+            if not has_next:
+                break
+        return rows, page, has_next
+
+    def archive(self, tag: str) -> str:
+        """Move the closed journal aside as ``<name>-<tag>.jsonl`` once the crawl output is saved.
+
+        The next run then opens an empty journal instead of replaying this
+        crawl, so pages and details come from the network (or the response
+        cache, within its TTLs) again. Returns the archived path.
+        """
+        root, ext = os.path.splitext(self.path)
+        dest = f"{root}-{tag}{ext}"
+        os.replace(self.path, dest)
+        return dest
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
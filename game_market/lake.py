@@ -0,0 +1,178 @@
+"""Raw-response lake: every list/detail payload archived in compressed append-only segments."""
+
+import glob
+import gzip
+import json
+import lzma
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .config import LAKE_CODEC, LAKE_DIR, LAKE_FLUSH_RECORDS, LAKE_PROCESSES, LAKE_SEGMENT_BYTES
+from .details import DETAIL_COLUMNS, join_names, parse_game_details
+from .listing import LIST_COLUMNS, LIST_SOURCED, parse_list_result
+from .telemetry import endpoint_name
+
+CODECS = {"gzip": (gzip.open, ".jsonl.gz"), "lzma": (lzma.open, ".jsonl.xz")}
+
+
+class ResponseLake:
+    """Appends ``{"ts", "kind", "body"}`` lines to ``root/<kind>-<stamp>-<pid>-<n>.jsonl.gz``.
+
+    Records are buffered per kind and written every ``flush_records``
+    records as one complete compressed member (gzip and xz both read
+    concatenated members as one stream), so everything up to the last flush
+    is readable right away, by :func:`rebuild_final` in the same session
+    too. A crash loses at most the unflushed records. Segments rotate after
+    about ``segment_bytes`` of raw JSON. Each writer process uses its own
+    file names, so shard workers can share one lake. Files are only ever
+    appended to.
+    """
+
+    def __init__(self, root: str = LAKE_DIR, codec: str = LAKE_CODEC, segment_bytes: int = LAKE_SEGMENT_BYTES,
+                 flush_records: int = LAKE_FLUSH_RECORDS):
+        self.root = root
+        self.opener, self.suffix = CODECS[codec]
+        self.segment_bytes = segment_bytes
+        self.flush_records = flush_records
+        self.prefix = f"{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self.records = 0
+        self._segments = {}     # kind → [raw byte sayısı, segment no]
+        self._pending = {}      # kind → [bekleyen satırlar]
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def append(self, kind: str, body) -> None:
+        line = (json.dumps({"ts": time.time(), "kind": kind, "body": body}, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            pending = self._pending.setdefault(kind, [])
+            pending.append(line)
+            self.records += 1
+            if len(pending) >= self.flush_records:
+                self._flush(kind)
+
+    def _flush(self, kind: str) -> None:
+        lines = self._pending.pop(kind, None)
+        if not lines:
+            return
+        size, n = self._segments.get(kind) or (0, 0)
+        if size >= self.segment_bytes:
+            size, n = 0, n + 1
+        path = os.path.join(self.root, f"{kind}-{self.prefix}-{n:04d}{self.suffix}")
+        data = b"".join(lines)
+        with self.opener(path, "ab") as fh:     # kapanınca tam bir sıkıştırılmış blok
+            fh.write(data)
+        self._segments[kind] = [size + len(data), n]
+
+    def flush(self) -> None:
+        """Write every buffered record now."""
+        with self._lock:
+            for kind in list(self._pending):
+                self._flush(kind)
+
+    def archive(self, url: str, body) -> None:
+        """Client hook: file ``body`` under ``list``, ``detail`` or the entity kind (``developers``, ...) by URL shape."""
+        self.append(endpoint_name(url), body)
+
+    def close(self) -> None:
+        self.flush()
+
+
+# Yeniden çıkarılabilir ek alanlar: ad → ham oyun nesnesinden değer (liste veya detay)
+EXTRACTORS = {
+    "playtime": lambda g: g.get("playtime"),
+    "rating": lambda g: g.get("rating"),
+    "esrb_rating": lambda g: (g.get("esrb_rating") or {}).get("name"),
+    "tags": lambda g: join_names(g.get("tags")),
+    "updated": lambda g: g.get("updated"),
+    "reviews_count": lambda g: g.get("reviews_count"),
+}
+
+
+def read_segment(path: str):
+    """Yield records of one segment; stops quietly at a torn tail."""
+    opener = lzma.open if path.endswith(".xz") else gzip.open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        try:
+            for line in fh:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return
+        except (EOFError, OSError, lzma.LZMAError, zlib.error):
+            return
+
+
+def game_detail(rec):
+    """Game detail payload of a record, or ``None`` for list pages and entity profiles.
+
+    Lakes written before entity profiles got their own kind filed them as
+    ``detail``; those are told apart by ``games_count``.
+    """
+    body = rec["body"]
+    if rec["kind"] != "detail" or body.get("id") is None or "games_count" in body:
+        return None
+    return body
+
+
+def _extract_segment(args):
+    path, fields = args
+    lists, details = [], {}
+    for rec in read_segment(path):
+        body, ts = rec["body"], rec["ts"]
+        if rec["kind"] == "list":
+            for g in body.get("results", []):
+                row = parse_list_result(g)
+                row.update({f: EXTRACTORS[f](g) for f in fields})
+                lists.append((ts, row))
+        elif game_detail(rec) is not None:
+            row = parse_game_details(body)
+            row.update({f: EXTRACTORS[f](body) for f in fields})
+            prev = details.get(row["rawg_id"])
+            if prev is None or prev[0] <= ts:
+                details[row["rawg_id"]] = (ts, row)
+    return lists, details
+
+
+def rebuild_final(root: str = LAKE_DIR, fields=(), processes: int = LAKE_PROCESSES) -> pd.DataFrame:
+    """Rebuild ``df_final`` (plus ``fields`` from :data:`EXTRACTORS`) from the lake, offline.
+
+    Segments are parsed in a process pool. List rows keep their first-seen
+    order, but for list rows and detail payloads alike the newest record per
+    id supplies the values, so a re-crawl or refresh replaces stale scores
+    and counts. List-sourced genres/stores take precedence as in
+    :func:`~game_market.sourcing.source_fields`. An extra field comes from
+    the detail payload when one exists, otherwise from the list result.
+    """
+    fields = list(fields)
+    unknown = [f for f in fields if f not in EXTRACTORS]
+    if unknown:
+        raise KeyError(f"unknown lake fields: {unknown}")
+    paths = sorted(glob.glob(os.path.join(root, "*.jsonl.*")))
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        parts = list(pool.map(_extract_segment, [(p, fields) for p in paths]))
+
+    list_rows, details = {}, {}
+    for lists, segment_details in parts:
+        for ts, row in lists:
+            prev = list_rows.get(row["rawg_id"])     # güncellenen anahtar sırasını korur
+            if prev is None or prev[0] <= ts:
+                list_rows[row["rawg_id"]] = (ts, row)
+        for rid, (ts, row) in segment_details.items():
+            if rid not in details or details[rid][0] <= ts:
+                details[rid] = (ts, row)
+
+    out = []
+    for rid, (_, row) in list_rows.items():
+        d = details.get(rid, (0, {}))[1]
+        merged = {c: row.get(c) for c in LIST_COLUMNS}
+        for c in DETAIL_COLUMNS[1:]:
+            merged[c] = row[c] if c in LIST_SOURCED and c in row else d.get(c)
+        for f in fields:
+            merged[f] = d[f] if f in d and d[f] is not None else row.get(f)
+        out.append(merged)
+    return pd.DataFrame(out, columns=LIST_COLUMNS + DETAIL_COLUMNS[1:] + fields)
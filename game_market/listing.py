@@ -0,0 +1,148 @@
+"""List crawl: ``GET /api/games`` pages → base fields per game."""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import LIST_WORKERS, ORDERING, PAGE_SIZE, TARGET
+from .details import join_names, join_store_names
+
+LIST_COLUMNS = ["rawg_id", "name", "released", "metacritic_x", "ratings_count", "added", "platforms"]
+
+# Liste yanıtında da gelen detay alanları (varsa detay çağrısına gerek yok)
+LIST_SOURCED = {"genres": join_names, "stores": join_store_names}
+
+
+def parse_list_result(g: dict) -> dict:
+    """List result → ``LIST_COLUMNS`` plus ``updated`` and any ``LIST_SOURCED`` field the payload carries."""
+    row = {
+        "rawg_id": g.get("id"),
+        "name": g.get("name"),
+        "released": g.get("released"),
+        "metacritic_x": g.get("metacritic"),
+        "ratings_count": g.get("ratings_count"),
+        "added": g.get("added"),
+        "platforms": ", ".join([p["platform"]["name"] for p in (g.get("platforms") or [])])
+    }
+    if "updated" in g:
+        row["updated"] = g["updated"]
+    for field, parse in LIST_SOURCED.items():
+        if field in g:
+            row[field] = parse(g[field])
+    return row
+
+
+def fetch_list_page(client, page: int, page_size: int = PAGE_SIZE, ordering: str = ORDERING, journal=None,
+                    filters=None):
+    """One list page → ``(rows, has_next, count)``; journaled when a journal is given.
+
+    ``filters`` are extra list parameters such as ``metacritic="90,100"`` or
+    ``dates="2010-01-01,2014-12-31"``.
+    """
+    data = client.list_games(page_size=page_size, page=page, ordering=ordering, **(filters or {}))
+    page_rows = [parse_list_result(g) for g in data.get("results", [])]
+    has_next = bool(data.get("next"))
+    if journal is not None:
+        journal.add_page(page, page_rows, has_next, data.get("count"))
+    return page_rows, has_next, data.get("count")
+
+
+def crawl_list(client, target: int = TARGET, page_size: int = PAGE_SIZE, ordering: str = ORDERING,
+               journal=None) -> list:
+    """Follow ``next`` page by page until ``target`` rows are collected.
+
+    With a :class:`~game_market.journal.CrawlJournal`, pages already in the
+    journal are reused and the crawl resumes from the first missing page.
+    Duplicate ``rawg_id`` values are dropped, as in
+    :func:`crawl_list_parallel`, and the crawl moves on to the next page
+    until ``target`` distinct rows are collected.
+    """
+    rows, seen = [], set()
+
+    def keep(batch):
+        for row in batch:
+            if len(rows) < target and row["rawg_id"] not in seen:
+                seen.add(row["rawg_id"])
+                rows.append(row)
+
+    page = 1
+    if journal is not None:
+        journaled, page, has_next = journal.list_cursor()
+        keep(journaled)
+        if journaled or page > 1:
+            print(f">> Günlükten devam: {page - 1} sayfa, {len(rows)} satır")
+        if not has_next:
+            return rows
+
+    while len(rows) < target:
+        page_rows, has_next, _ = fetch_list_page(client, page, page_size, ordering, journal)
+        keep(page_rows)
+
+        if not has_next:
+            print(">> Sayfa bitti (next yok).")
+            break
+        page += 1
+        if page % 5 == 0:
+            print(f"  - İşlenen sayfa: {page}, toplanan satır: {len(rows)}")
+    return rows
+
+
+def crawl_list_parallel(client, target: int = TARGET, page_size: int = PAGE_SIZE, ordering: str = ORDERING,
+                        workers: int = LIST_WORKERS, journal=None, filters=None, sink=None) -> list:
+    """Fetch all list pages up to ``target`` concurrently.
+
+    Page 1 returns ``count``, so the page set ``1..ceil(min(count, target) /
+    page_size)`` is known up front. Those pages are fetched ``workers`` at a
+    time, at most ``2 * workers`` pages ahead of the one being consumed, and
+    results are emitted strictly in page order as pages complete.
+    Duplicate ``rawg_id`` values are dropped while streaming. If duplicates
+    leave the result short of ``target``, the crawl continues with the
+    following pages. Pages already in ``journal`` are not fetched again.
+    ``filters`` narrow the result set (see :func:`fetch_list_page`).
+
+    With a ``sink`` (e.g. :class:`~game_market.columnar.ColumnarSink`), each
+    emitted row goes to ``sink.append`` instead of being kept in memory, and
+    the returned list stays empty. The sink owns deduplication then.
+    """
+    done = dict(journal.pages) if journal is not None else {}
+
+    def fetch(page):
+        if page in done:
+            return done[page]
+        return fetch_list_page(client, page, page_size, ordering, journal, filters)[:2]
+
+    if 1 in done:
+        count = journal.count
+    else:
+        page_rows, has_next, count = fetch_list_page(client, 1, page_size, ordering, journal, filters)
+        done[1] = (page_rows, has_next)
+    # sayım bilinmiyorsa önden çekim yok; sayfalar next'e göre tek tek gelir
+    last = max(1, math.ceil(min(count, target) / page_size)) if count is not None else 1
+
+    rows, emitted = [], 0
+    seen = getattr(sink, "seen", None)
+    seen = set() if seen is None else seen
+    emit = rows.append if sink is None else sink.append
+    page, has_next = 1, True
+    futures, ahead = {}, 2
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while emitted < target and has_next:
+            # önden çekim penceresi: tamamlanmış sayfalar bellekte birikmesin
+            while ahead <= min(last, page + 2 * workers):
+                futures[ahead] = pool.submit(fetch, ahead)
+                ahead += 1
+            fut = futures.pop(page, None)
+            page_rows, has_next = fut.result() if fut else fetch(page)
+            for row in page_rows:
+                if row["rawg_id"] in seen or emitted >= target:
+                    continue
+                emit(row)
+                seen.add(row["rawg_id"])
+                emitted += 1
+            if page % 5 == 0:
+                print(f"  - İşlenen sayfa: {page}, toplanan satır: {emitted}")
+            page += 1
+        for fut in futures.values():
+            fut.cancel()
+    if not has_next:
+        print(">> Sayfa bitti (next yok).")
+    return rows
@@ -0,0 +1,160 @@
+"""Memory-mapped numeric column cache for ``df_final`` CSVs, keyed by the source file's sha256."""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from .config import MMAP_DIR
+from .dataset import LIST_FIELDS, split_names
+from .dates import parse_dates
+
+# Sütun → tip; eksik değer -1 (yıl/ay/gün için 0)
+NUMERIC_COLUMNS = {
+    "rawg_id": np.int64,
+    "metacritic_x": np.int16,
+    "ratings_count": np.int32,
+    "added": np.int32,
+    "release_year": np.int16,
+    "release_month": np.int8,
+    "release_day": np.int8,
+}
+
+
+def file_digest(path: str, block: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(block), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _stat_key(path: str) -> str:
+    st = os.stat(path)
+    return f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+
+
+def source_digest(path: str, root: str = MMAP_DIR) -> str:
+    """sha256 of ``path``, remembered per (path, size, mtime) in ``root/digests.json``.
+
+    A warm start only ``stat``s the file; the file is re-hashed when it changed.
+    """
+    index_path = os.path.join(root, "digests.json")
+    try:
+        with open(index_path, encoding="utf-8") as fh:
+            index = json.load(fh)
+    except (FileNotFoundError, ValueError):
+        index = {}
+    key = _stat_key(path)
+    if key not in index:
+        index[key] = file_digest(path)
+        os.makedirs(root, exist_ok=True)
+        tmp = index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(index, fh, indent=0)
+        os.replace(tmp, index_path)
+    return index[key]
+
+
+def build_column_cache(csv_path: str, root: str = MMAP_DIR) -> str:
+    """Parse ``csv_path`` once and write each column as a ``.npy`` under ``root/<digest>/``.
+
+    List fields become ``<field>.values`` (int32 codes into
+    ``dictionaries.json``) plus ``<field>.offsets`` (int64, n + 1), the same
+    layout as :class:`~game_market.columnar.ColumnarSink`. The directory is
+    written under a temporary name and renamed, so readers never see half a
+    cache.
+    """
+    digest = source_digest(csv_path, root)
+    out = os.path.join(root, digest)
+    if os.path.exists(os.path.join(out, "meta.json")):
+        return out
+    df = pd.read_csv(csv_path)
+    released = parse_dates(df["released"])[0]
+    cols = {
+        "rawg_id": df["rawg_id"],
+        "metacritic_x": df["metacritic_x"],
+        "ratings_count": df["ratings_count"],
+        "added": df["added"],
+        "release_year": released.dt.year,
+        "release_month": released.dt.month,
+        "release_day": released.dt.day,
+    }
+    tmp = f"{out}.tmp{os.getpid()}"
+    os.makedirs(tmp, exist_ok=True)
+    for c, t in NUMERIC_COLUMNS.items():
+        missing = 0 if c.startswith("release_") else -1
+        np.save(os.path.join(tmp, f"{c}.npy"), pd.to_numeric(cols[c], errors="coerce").fillna(missing).to_numpy(t))
+    dictionaries = {}
+    for f in LIST_FIELDS:
+        codes, values, offsets = {}, [], [0]
+        for s in df[f] if f in df.columns else [None] * len(df):
+            for name in split_names(s) or ():
+                values.append(codes.setdefault(name, len(codes)))
+            offsets.append(len(values))
+        np.save(os.path.join(tmp, f"{f}.values.npy"), np.asarray(values, dtype=np.int32))
+        np.save(os.path.join(tmp, f"{f}.offsets.npy"), np.asarray(offsets, dtype=np.int64))
+        dictionaries[f] = sorted(codes, key=codes.get)
+    with open(os.path.join(tmp, "dictionaries.json"), "w", encoding="utf-8") as fh:
+        json.dump(dictionaries, fh, ensure_ascii=False)
+    with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as fh:
+        json.dump({"source": os.path.abspath(csv_path), "sha256": digest, "rows": len(df)}, fh)
+    try:
+        os.rename(tmp, out)
+    except OSError:     # başka bir süreç aynı önbelleği önce yazdı
+        shutil.rmtree(tmp, ignore_errors=True)
+    return out
+
+
+class ColumnCache:
+    """Read-only view of a :func:`build_column_cache` directory.
+
+    ``cache["metacritic_x"]`` is an ``np.load(..., mmap_mode="r")`` array:
+    nothing is parsed or copied, and every process that opens the same cache
+    shares the same page-cache pages. Arrays are opened on first access.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as fh:
+            self.meta = json.load(fh)
+        self._arrays = {}
+        self._dictionaries = None
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        arr = self._arrays.get(name)
+        if arr is None:
+            arr = self._arrays[name] = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+        return arr
+
+    def __len__(self) -> int:
+        return self.meta["rows"]
+
+    @property
+    def dictionaries(self) -> dict:
+        if self._dictionaries is None:
+            with open(os.path.join(self.path, "dictionaries.json"), encoding="utf-8") as fh:
+                self._dictionaries = json.load(fh)
+        return self._dictionaries
+
+    def entity_ids(self, field: str):
+        """``(values, offsets)`` for a list field: game ``i`` has codes ``values[offsets[i]:offsets[i + 1]]``."""
+        return self[f"{field}.values"], self[f"{field}.offsets"]
+
+    def frame(self, columns=None) -> pd.DataFrame:
+        """Numeric columns as a DataFrame (missing values back as ``NA``)."""
+        out = {}
+        for c in columns or NUMERIC_COLUMNS:
+            arr = self[c]
+            missing = 0 if c.startswith("release_") else -1
+            s = pd.Series(arr)
+            out[c] = s if c == "rawg_id" else s.where(s != missing).astype(f"Int{arr.dtype.itemsize * 8}")
+        return pd.DataFrame(out)
+
+
+def load_columns(csv_path: str, root: str = MMAP_DIR) -> ColumnCache:
+    """Open the cache for ``csv_path``, building it first if this file content was never cached."""
+    return ColumnCache(build_column_cache(csv_path, root))
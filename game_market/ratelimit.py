@@ -0,0 +1,80 @@
+"""Adaptive token-bucket rate limiter shared by all fetch workers."""
+
+import random
+import threading
+import time
+
+from .config import (BACKOFF_BASE, BACKOFF_MAX, RATE_DECREASE_THROTTLE, RATE_DECREASE_WINDOW, RATE_INITIAL, RATE_MAX,
+                     RATE_MIN, RATE_STEP)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate follows what the server allows.
+
+    Every request takes one token in :meth:`acquire`, and tokens refill at
+    ``rate`` per second. While responses are healthy the rate grows by
+    ``step`` per second of elapsed time, up to ``max_rate`` (additive
+    increase; it does not depend on how many requests are in flight). A
+    throttled or failed response multiplies it by ``factor``, never going
+    below ``min_rate`` (multiplicative decrease), at most once per
+    ``window`` seconds: the other in-flight requests that fail in the same
+    burst are one congestion event, not ``workers`` of them. A
+    ``Retry-After`` header pauses the whole bucket for that long. So throughput settles just below the server's real
+    limit instead of a fixed sleep.
+    """
+
+    def __init__(self, rate: float = RATE_INITIAL, min_rate: float = RATE_MIN,
+                 max_rate: float = RATE_MAX, step: float = RATE_STEP, burst: float = 1.0,
+                 window: float = RATE_DECREASE_WINDOW):
+        if rate <= 0 or min_rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.step = step
+        self.burst = burst
+        self.window = window
+        self._tokens = burst
+        self._stamp = time.monotonic()
+        self._grown = self._stamp           # son artışın zamanı
+        self._decreased = float("-inf")     # son düşüşün zamanı
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+                    self._stamp = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            # boşta geçen süre artış sayılmaz: en fazla 1 sn'lik birikim
+            self.rate = min(self.max_rate, self.rate + self.step * min(now - self._grown, 1.0))
+            self._grown = now
+
+    def on_throttle(self, retry_after: float = None, factor: float = RATE_DECREASE_THROTTLE) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._decreased >= self.window:
+                self.rate = max(self.min_rate, self.rate * factor)
+                self._decreased = now
+            self._tokens = 0.0
+            self._grown = now
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
@@ -0,0 +1,157 @@
+"""Incremental refresh: re-fetch details only for new or changed games."""
+
+import json
+import math
+import os
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from .config import DETAIL_WORKERS, DLQ_PATH, LIST_WORKERS, SNAPSHOT_DIR, TARGET
+from .deadletter import DeadLetterQueue
+from .details import DETAIL_COLUMNS
+from .listing import LIST_COLUMNS, crawl_list_parallel
+from .sourcing import source_fields
+
+# Bu alanlardan biri değiştiyse oyunun detayı yeniden çekilir
+CHANGE_COLUMNS = ["updated", "ratings_count", "added"]
+# Bunlar değişirse satır yeni snapshot'a yazılır (detay önceki snapshot'tan gelir)
+LIST_DELTA_COLUMNS = CHANGE_COLUMNS + ["metacritic_x", "name"]
+# detail_status: "ok" / "fetch_failed" (bkz. deadletter.mark_fetch_failures)
+SNAPSHOT_COLUMNS = LIST_COLUMNS + DETAIL_COLUMNS[1:] + ["updated", "detail_status"]
+
+
+def _norm(v) -> str:
+    if v is None or (isinstance(v, float) and math.isnan(v)):
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v)
+
+
+def load_snapshot(path: str) -> pd.DataFrame:
+    """A plain CSV, or a manifest whose parts are applied in order.
+
+    Each manifest part is ``{"file": csv, "removed": [ids]}``. Its rows
+    replace earlier rows with the same ``rawg_id``, and its removed ids drop
+    out. Unchanged rows therefore stay in the older files and are shared
+    between snapshots.
+    """
+    if not path.endswith(".json"):
+        return pd.read_csv(path)
+    with open(path, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    base = os.path.dirname(path)
+    df = None
+    for part in manifest["parts"]:
+        rows = pd.read_csv(os.path.join(base, part["file"]))
+        if df is not None:
+            rows = pd.concat([df[~df["rawg_id"].isin(rows["rawg_id"])], rows], ignore_index=True)
+        df = rows[~rows["rawg_id"].isin(part.get("removed", []))]
+    return (df.sort_values(["metacritic_x", "rawg_id"], ascending=[False, True])
+              .reset_index(drop=True))
+
+
+def diff_list(prev: pd.DataFrame, list_rows: list):
+    """Classify fresh list rows against ``prev``.
+
+    Returns ``(new_ids, changed_ids, list_only_ids, removed_ids)``.
+    ``changed`` means a ``CHANGE_COLUMNS`` value moved, so the detail needs a
+    re-fetch. ``list_only`` rows differ only in other list fields, so their
+    detail columns are carried over. A column the previous snapshot does
+    not have, such as ``updated`` in an old CSV, is not compared. Where the
+    column exists, an empty previous value that now has one (for example a
+    row carried over from a part written without ``updated``) counts as a
+    change.
+    """
+    prev_by_id = prev.set_index("rawg_id")
+    new, changed, list_only = [], [], []
+    for row in list_rows:
+        rid = row["rawg_id"]
+        if rid not in prev_by_id.index:
+            new.append(rid)
+            continue
+        old = prev_by_id.loc[rid]
+
+        def moved(c):
+            return c in old.index and _norm(old[c]) != _norm(row.get(c))
+
+        if any(moved(c) for c in CHANGE_COLUMNS):
+            changed.append(rid)
+        elif any(moved(c) for c in LIST_DELTA_COLUMNS):
+            list_only.append(rid)
+    current = {row["rawg_id"] for row in list_rows}
+    removed = [int(rid) for rid in prev["rawg_id"] if rid not in current]
+    return new, changed, list_only, removed
+
+
+def refresh(client, prev_path: str, target: int = TARGET, out_dir: str = SNAPSHOT_DIR,
+            workers: int = DETAIL_WORKERS, list_workers: int = LIST_WORKERS, dead_letters=None):
+    """Walk the list endpoint, fetch details only for new/changed games, write a delta snapshot.
+
+    Cost: the list pages plus one detail call per new or changed game. The
+    new snapshot is a manifest that reuses the previous parts and adds one
+    delta CSV. Returns ``(df, manifest_path, report)``.
+
+    A detail call that fails goes to ``dead_letters`` (a
+    :class:`~game_market.deadletter.DeadLetterQueue`, ``DLQ_PATH`` by
+    default). A changed game whose call failed is left out of the delta, so
+    its previous row, detail columns included, stays in the snapshot and the
+    next refresh sees the change again. A new game is still written with its
+    list values and ``detail_status = "fetch_failed"`` and stays queued for
+    :func:`~game_market.deadletter.drain_dead_letters`.
+    """
+    prev = load_snapshot(prev_path)
+    rows = crawl_list_parallel(client, target=target, workers=list_workers)
+    new, changed, list_only, removed = diff_list(prev, rows)
+    refetch = set(new) | set(changed)
+    print(f">> Yenileme: {len(new)} yeni, {len(changed)} değişen, {len(list_only)} sadece liste, "
+          f"{len(removed)} listeden çıkan")
+
+    dlq = dead_letters if dead_letters is not None else DeadLetterQueue(DLQ_PATH)
+    try:
+        details, _ = source_fields([r for r in rows if r["rawg_id"] in refetch], client, workers=workers,
+                                   dead_letters=dlq)
+        failed = refetch & set(dlq.ids())
+    finally:
+        if dead_letters is None:
+            dlq.close()
+    details = {d["rawg_id"]: d for d in details}
+    prev_by_id = prev.set_index("rawg_id")
+    delta = []
+    for row in rows:
+        rid = row["rawg_id"]
+        if rid in failed and rid in changed:
+            continue
+        if rid in refetch:
+            d = details[rid]
+            status = "fetch_failed" if rid in failed else "ok"
+        elif rid in list_only:
+            old = prev_by_id.loc[rid]
+            d = old[DETAIL_COLUMNS[1:]].to_dict()
+            status = old.get("detail_status", "ok")
+        else:
+            continue
+        delta.append(dict({c: row.get(c) for c in LIST_COLUMNS + ["updated"]},
+                          **{c: d.get(c) for c in DETAIL_COLUMNS[1:]}, detail_status=status))
+
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    delta_csv = f"delta_{stamp}.csv"
+    pd.DataFrame(delta, columns=SNAPSHOT_COLUMNS).to_csv(os.path.join(out_dir, delta_csv), index=False)
+    if prev_path.endswith(".json"):
+        with open(prev_path, encoding="utf-8") as fh:
+            parts = json.load(fh)["parts"]
+        prev_dir = os.path.dirname(os.path.abspath(prev_path))
+        parts = [dict(p, file=os.path.relpath(os.path.join(prev_dir, p["file"]), os.path.abspath(out_dir)))
+                 for p in parts]
+    else:
+        parts = [{"file": os.path.relpath(os.path.abspath(prev_path), os.path.abspath(out_dir)), "removed": []}]
+    parts.append({"file": delta_csv, "removed": removed})
+    manifest_path = os.path.join(out_dir, f"snapshot_{stamp}.json")
+    with open(manifest_path, "w", encoding="utf-8") as fh:
+        json.dump({"created": stamp, "parts": parts}, fh, indent=1)
+
+    report = {"new": len(new), "changed": len(changed), "list_only": len(list_only),
+              "removed": len(removed), "detail_calls": len(refetch), "detail_failed": len(failed)}
+    return load_snapshot(manifest_path), manifest_path, report
@@ -0,0 +1,73 @@
+"""Value-prioritized detail scheduling with coverage-by-segment progress."""
+
+import heapq
+import threading
+
+from .config import PRIORITY_THRESH
+
+
+def default_value(row: dict):
+    """84+ metacritic first, then the most ``added`` (player interest)."""
+    mc = row.get("metacritic_x") or 0
+    return (mc >= PRIORITY_THRESH, row.get("added") or 0, mc)
+
+
+def default_segment(row: dict) -> str:
+    mc = row.get("metacritic_x") or 0
+    if mc >= PRIORITY_THRESH:
+        return f"{PRIORITY_THRESH}+"
+    if mc >= 75:
+        return f"75-{PRIORITY_THRESH - 1}"
+    return "<75"
+
+
+class CrawlScheduler:
+    """Orders detail fetches by ``value(row)`` (highest first) and tracks coverage.
+
+    ``value`` returns a number or a tuple of numbers, compared element-wise.
+
+    :meth:`order` drains a heap, so the most valuable games are fetched
+    first. If the crawl stops early, the best segments are already complete.
+    :meth:`coverage` and :meth:`progress_line` show done/total per
+    ``segment(row)``, and :meth:`covered_ids` gives the ids that are already
+    enriched, so an analysis can run on a fully covered segment.
+    """
+
+    def __init__(self, list_rows, value=default_value, segment=default_segment):
+        self.rows = {int(r["rawg_id"]): r for r in list_rows}
+        self.value = value
+        self.segment_of = {rid: segment(r) for rid, r in self.rows.items()}
+        self.done = set()
+        self._lock = threading.Lock()
+
+    def order(self, ids=None) -> list:
+        """``ids`` (default: all) from most to least valuable; ties keep list order."""
+        ids = self.rows if ids is None else ids
+        heap = [(_max_key(self.value(self.rows[int(i)])), n, int(i)) for n, i in enumerate(ids)]
+        heapq.heapify(heap)
+        return [heapq.heappop(heap)[2] for _ in range(len(heap))]
+
+    def mark_done(self, rawg_id: int) -> None:
+        with self._lock:
+            self.done.add(int(rawg_id))
+
+    def coverage(self) -> list:
+        stats = {}
+        for rid, seg in self.segment_of.items():
+            s = stats.setdefault(seg, {"segment": seg, "total": 0, "done": 0})
+            s["total"] += 1
+            s["done"] += rid in self.done
+        for s in stats.values():
+            s["pct"] = round(s["done"] / s["total"] * 100, 1)
+        return sorted(stats.values(), key=lambda s: -s["pct"])
+
+    def progress_line(self) -> str:
+        return " | ".join(f"{s['segment']}: {s['done']}/{s['total']} ({s['pct']}%)" for s in self.coverage())
+
+    def covered_ids(self, segment: str = None) -> list:
+        return sorted(rid for rid in self.done if segment is None or self.segment_of.get(rid) == segment)
+
+
+def _max_key(v) -> tuple:
+    # heapq küçükten büyüğe çalışır; değer (sayı veya sayı tuple'ı) negatiflenir
+    return tuple(-x for x in (v if isinstance(v, tuple) else (v,)))
@@ -0,0 +1,92 @@
+"""Sharded full-catalog crawl: metacritic bands × release-date windows, one process per shard."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+
+import pandas as pd
+
+from .cache import ResponseCache
+from .client import RawgClient
+from .config import (CACHE_DIR, DETAIL_WORKERS, LAKE_DIR, LIST_WORKERS, ORDERING, RAWG_BASE, SHARD_DIR,
+                     SHARD_FIRST_YEAR, SHARD_PROCESSES, SHARD_SCORE_BANDS, SHARD_YEARS)
+from .journal import CrawlJournal
+from .lake import ResponseLake
+from .listing import LIST_COLUMNS, crawl_list_parallel
+from .sourcing import source_fields
+
+# Tek bir shard'ın sayfa sınırı yok; sayım (count) neyse o kadar çekilir
+SHARD_TARGET = 10 ** 9
+
+
+def plan_shards(score_bands=SHARD_SCORE_BANDS, first_year: int = SHARD_FIRST_YEAR,
+                last_year: int = None, years: int = SHARD_YEARS) -> list:
+    """Split the catalog into disjoint list filters.
+
+    Each shard is a dict like ``{"name": "mc90-94_2010-2014", "metacritic":
+    "90,94", "dates": "2010-01-01,2014-12-31"}``. The filters go straight into
+    ``GET /api/games``, so every shard only pages through its own slice
+    instead of one deep ``page=n`` walk over ``ordering=-metacritic``.
+    """
+    last_year = last_year or date.today().year
+    shards = []
+    for lo, hi in score_bands:
+        for start in range(first_year, last_year + 1, years):
+            end = min(start + years - 1, last_year)
+            shards.append({
+                "name": f"mc{lo}-{hi}_{start}-{end}",
+                "metacritic": f"{lo},{hi}",
+                "dates": f"{start}-01-01,{end}-12-31",
+            })
+    return shards
+
+
+def crawl_shard(shard: dict, key: str, base: str = RAWG_BASE, shard_dir: str = SHARD_DIR,
+                list_workers: int = LIST_WORKERS, detail_workers: int = DETAIL_WORKERS,
+                cache_dir: str = CACHE_DIR, lake_dir: str = LAKE_DIR) -> list:
+    """List + detail crawl of one shard inside a worker process.
+
+    Every process builds its own client (session, limiter), so the total
+    request rate is about ``processes × RATE_INITIAL`` at the start; each
+    limiter backs off on its own when the server pushes back. Progress is
+    journaled per shard under ``shard_dir``, so a re-run resumes. The client
+    reads and fills the shared response cache in ``cache_dir`` and archives
+    raw responses under ``lake_dir`` in segments named after its own pid
+    (``None`` turns either off).
+    """
+    filters = {k: v for k, v in shard.items() if k != "name"}
+    cache = ResponseCache(cache_dir) if cache_dir else None
+    lake = ResponseLake(lake_dir) if lake_dir else None
+    with RawgClient(key, base=base, pool_maxsize=max(list_workers, detail_workers), cache=cache, lake=lake) as client, \
+            CrawlJournal(os.path.join(shard_dir, shard["name"] + ".jsonl")) as journal:
+        rows = crawl_list_parallel(client, target=SHARD_TARGET, ordering=ORDERING, workers=list_workers,
+                                   journal=journal, filters=filters)
+        details, _ = source_fields(rows, client, workers=detail_workers, journal=journal)
+    return [dict({c: r[c] for c in LIST_COLUMNS}, **d) for r, d in zip(rows, details)]
+
+
+def run_sharded_crawl(key: str, shards=None, processes: int = SHARD_PROCESSES, base: str = RAWG_BASE,
+                      shard_dir: str = SHARD_DIR, cache_dir: str = CACHE_DIR, lake_dir: str = LAKE_DIR) -> pd.DataFrame:
+    """Crawl all ``shards`` in ``processes`` worker processes and merge them.
+
+    Shards are independent, so wall-clock time falls roughly linearly with
+    ``processes`` until the API's rate limit is reached. The merge drops
+    duplicate ``rawg_id`` values, which show up when a game moves between
+    shards mid-crawl, and sorts the result by metacritic like the single
+    list crawl does.
+    """
+    shards = shards if shards is not None else plan_shards()
+    frames = []
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = {pool.submit(crawl_shard, s, key, base, shard_dir, cache_dir=cache_dir, lake_dir=lake_dir): s["name"]
+                   for s in shards}
+        for i, fut in enumerate(as_completed(futures), start=1):
+            rows = fut.result()
+            frames.append(pd.DataFrame(rows))
+            print(f"  - Shard {i}/{len(shards)} bitti: {futures[fut]} ({len(rows)} oyun)")
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if df.empty:
+        return df
+    return (df.drop_duplicates(subset=["rawg_id"])
+              .sort_values(["metacritic_x", "rawg_id"], ascending=[False, True])
+              .reset_index(drop=True))
@@ -0,0 +1,67 @@
+"""Field sourcing: take each detail column from the cheapest endpoint that has it."""
+
+from .config import DETAIL_WORKERS
+from .details import DETAIL_COLUMNS, enrich_details
+
+# Alan → onu taşıyan uç noktalar (ucuzdan pahalıya). Liste satırı zaten elimizde,
+# detay ise oyun başına ayrı bir istek.
+FIELD_SOURCES = {
+    "developers": ("detail",),
+    "publishers": ("detail",),
+    "genres": ("list", "detail"),
+    "stores": ("list", "detail"),
+}
+
+
+def plan_sources(list_rows, fields=None):
+    """Which ids still need ``GET /api/games/{id}`` for ``fields``.
+
+    A field counts as sourced from the list when ``FIELD_SOURCES`` allows it
+    and the list row actually carries the key (``None`` there means RAWG has
+    no value, not that it is missing). Returns ``(ids_needing_detail,
+    report)``.
+    """
+    fields = list(fields or [c for c in DETAIL_COLUMNS if c != "rawg_id"])
+    need, from_list = [], 0
+    for row in list_rows:
+        missing = [f for f in fields if "list" not in FIELD_SOURCES[f] or f not in row]
+        from_list += len(fields) - len(missing)
+        if missing:
+            need.append(int(row["rawg_id"]))
+    report = {
+        "games": len(list_rows),
+        "detail_calls": len(need),
+        "saved_calls": len(list_rows) - len(need),
+        "fields_from_list": from_list,
+    }
+    return need, report
+
+
+def source_fields(list_rows, client, fields=None, workers: int = DETAIL_WORKERS, journal=None,
+                  on_payload=None, dead_letters=None, scheduler=None):
+    """Detail rows (``DETAIL_COLUMNS`` contract) with the fewest detail calls.
+
+    List-sourced values win; the detail endpoint fills only what the list row
+    lacks. So when a detail call fails, the genres/stores from the list are
+    still kept. Returns ``(rows, report)`` in ``list_rows`` order.
+    """
+    fields = list(fields or [c for c in DETAIL_COLUMNS if c != "rawg_id"])
+    need, report = plan_sources(list_rows, fields)
+    if scheduler is not None:
+        for rid in set(int(r["rawg_id"]) for r in list_rows) - set(need):
+            scheduler.mark_done(rid)
+    fetched = {}
+    if need:
+        for d in enrich_details(need, client, workers=workers, journal=journal, on_payload=on_payload,
+                                dead_letters=dead_letters, scheduler=scheduler):
+            fetched[d["rawg_id"]] = d
+    rows = []
+    for row in list_rows:
+        rid = int(row["rawg_id"])
+        d = fetched.get(rid, {})
+        out = {"rawg_id": rid}
+        for f in fields:
+            out[f] = row[f] if "list" in FIELD_SOURCES[f] and f in row else d.get(f)
+        rows.append(out)
+    print(f">> Alan kaynakları: {report['detail_calls']} detay çağrısı, {report['saved_calls']} çağrı tasarruf")
+    return rows, report
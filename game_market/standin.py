@@ -0,0 +1,261 @@
+"""Local RAWG stand-in: ``/api/games`` and ``/api/games/{id}`` from fixtures, with latency and faults."""
+
+import glob
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import pandas as pd
+
+from .dates import parse_dates
+
+# Liste yanıtında da dönen alanlar (gerisi sadece detayda)
+LIST_FIELDS = ("id", "slug", "name", "released", "metacritic", "rating", "ratings_count", "added", "updated",
+               "playtime", "platforms", "genres", "stores", "tags", "esrb_rating")
+MAX_PAGE_SIZE = 40
+
+
+def _named(names):
+    return [{"id": zlib.crc32(n.encode("utf-8")) % 10 ** 6, "name": n, "slug": n.lower().replace(" ", "-")} for n in names]
+
+
+def _split(s):
+    return [x.strip() for x in s.split(",") if x.strip()] if isinstance(s, str) else []
+
+
+def fixtures_from_csv(path: str) -> list:
+    """Game payloads from an exported ``df_final`` CSV (e.g. ``rawg_5000_games_sample.csv``)."""
+    df = pd.read_csv(path)
+    df["released"] = parse_dates(df["released"])[0]
+    games = []
+    for row in df.to_dict("records"):
+        released = row.get("released")
+        games.append({
+            "id": int(row["rawg_id"]),
+            "name": row.get("name"),
+            "released": None if pd.isna(released) else released.strftime("%Y-%m-%d"),
+            "metacritic": None if pd.isna(row.get("metacritic_x")) else int(row["metacritic_x"]),
+            "ratings_count": None if pd.isna(row.get("ratings_count")) else int(row["ratings_count"]),
+            "added": None if pd.isna(row.get("added")) else int(row["added"]),
+            "platforms": [{"platform": p} for p in _named(_split(row.get("platforms")))],
+            "developers": _named(_split(row.get("developers"))),
+            "publishers": _named(_split(row.get("publishers"))),
+            "genres": _named(_split(row.get("genres"))),
+            "stores": [{"id": s["id"], "store": s} for s in _named(_split(row.get("stores")))],
+        })
+    return games
+
+
+def fixtures_from_lake(root: str) -> list:
+    """Recorded payloads from a :class:`~game_market.lake.ResponseLake` (detail wins over list).
+
+    Entity profiles in the lake are skipped, since they are not game payloads.
+    """
+    from .lake import game_detail, read_segment
+    games = {}
+    for path in sorted(glob.glob(os.path.join(root, "*.jsonl.*"))):
+        for rec in read_segment(path):
+            if rec["kind"] == "list":
+                for g in rec["body"].get("results", []):
+                    games.setdefault(g["id"], {}).update(g)
+            elif game_detail(rec) is not None:
+                games.setdefault(rec["body"]["id"], {}).update(rec["body"])
+    return list(games.values())
+
+
+def synthetic_catalog(n: int = 5000, seed: int = 0) -> list:
+    """``n`` made-up games with RAWG-shaped list/detail fields."""
+    rnd = random.Random(seed)
+    platforms = ["PC", "PlayStation 4", "Xbox One", "Nintendo Switch", "PlayStation 5", "Xbox Series S/X", "iOS"]
+    genres = ["Action", "Adventure", "RPG", "Shooter", "Platformer", "Puzzle", "Strategy", "Indie", "Card"]
+    stores = ["Steam", "PlayStation Store", "Xbox Store", "Nintendo Store", "Epic Games", "GOG", "App Store"]
+    devs = [f"Studio {i}" for i in range(max(10, n // 8))]
+    pubs = [f"Publisher {i}" for i in range(max(5, n // 25))]
+    games = []
+    for i in range(1, n + 1):
+        year = rnd.randint(1985, 2024)
+        games.append({
+            "id": i,
+            "name": f"Game {i}",
+            "released": f"{year}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+            "metacritic": int(min(99, max(40, rnd.gauss(74, 9)))),
+            "rating": round(rnd.uniform(2.5, 4.9), 2),
+            "ratings_count": int(rnd.paretovariate(1.2) * 20),
+            "added": int(rnd.paretovariate(1.1) * 60),
+            "updated": f"2025-{rnd.randint(1, 8):02d}-01T00:00:00",
+            "playtime": rnd.randint(0, 80),
+            "platforms": [{"platform": p} for p in _named(rnd.sample(platforms, rnd.randint(1, 4)))],
+            "genres": _named(rnd.sample(genres, rnd.randint(1, 3))),
+            "stores": [{"id": s["id"], "store": s} for s in _named(rnd.sample(stores, rnd.randint(0, 3)))],
+            "developers": _named(rnd.sample(devs, 1)),
+            "publishers": _named(rnd.sample(pubs, rnd.randint(0, 2))),
+        })
+    return games
+
+
+class Latency:
+    """Per-request delay: ``fixed`` (a), ``uniform`` (a..b) or ``lognormal`` (median a, sigma b), in seconds."""
+
+    def __init__(self, kind: str = "fixed", a: float = 0.0, b: float = 0.0, seed: int = None):
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"unknown latency kind: {kind}")
+        self.kind, self.a, self.b = kind, a, b
+        self._rnd = random.Random(seed)
+
+    def sample(self) -> float:
+        if self.kind == "uniform":
+            return self._rnd.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return self.a * self._rnd.lognormvariate(0, self.b)
+        return self.a
+
+
+class StandInServer:
+    """Threaded HTTP server that behaves like the parts of RAWG the crawl uses.
+
+    * ``GET /api/games``: ``ordering=-metacritic``, ``page``, ``page_size``
+      (max 40), ``metacritic=lo,hi`` and ``dates=from,to`` filters, plus
+      ``count`` / ``next`` / ``previous``. A page past the end returns 404,
+      as on RAWG.
+    * ``GET /api/games/{id}``: the full fixture. ``/api/{developers,publishers}/{id}``
+      returns entity profiles.
+    * Faults: ``rate_429`` / ``rate_502`` are per-request probabilities
+      (429 carries ``Retry-After: retry_after``), and ``bad_ids`` always
+      answer 502 like RAWG's broken old records.
+
+    ``requests`` counts handled requests per endpoint.
+    """
+
+    def __init__(self, games, latency: Latency = None, rate_429: float = 0.0, rate_502: float = 0.0,
+                 retry_after: float = 1.0, bad_ids=(), seed: int = None, host: str = "127.0.0.1", port: int = 0):
+        self.games = {int(g["id"]): g for g in games}
+        self.ranked = sorted(self.games.values(), key=lambda g: (-(g.get("metacritic") or 0), g["id"]))
+        self.entities = {}
+        for g in self.games.values():
+            for kind in ("developers", "publishers"):
+                for e in g.get(kind) or []:
+                    prof = self.entities.setdefault((kind, e["id"]), dict(e, games_count=0))
+                    prof["games_count"] += 1
+        self.latency = latency or Latency()
+        self.rate_429, self.rate_502, self.retry_after = rate_429, rate_502, retry_after
+        self.bad_ids = set(bad_ids)
+        self.requests = {"list": 0, "detail": 0, "entity": 0, "error": 0}
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/games"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.requests[key] += 1
+
+    def _fault(self):
+        with self._lock:
+            r = self._rnd.random()
+        if r < self.rate_429:
+            return 429
+        if r < self.rate_429 + self.rate_502:
+            return 502
+        return None
+
+    def list_page(self, query: dict, url: str):
+        games = self.ranked
+        if "metacritic" in query:
+            lo, hi = (int(x) for x in query["metacritic"].split(","))
+            games = [g for g in games if g.get("metacritic") is not None and lo <= g["metacritic"] <= hi]
+        if "dates" in query:
+            lo, hi = query["dates"].split(",")
+            games = [g for g in games if g.get("released") and lo <= g["released"] <= hi]
+        page = int(query.get("page", 1))
+        size = min(int(query.get("page_size", 20)), MAX_PAGE_SIZE)
+        start = (page - 1) * size
+        if page < 1 or (start >= len(games) and page > 1):
+            return 404, {"detail": "Invalid page."}
+
+        def link(p):
+            return f"{url}?{urlencode(dict(query, page=p))}"
+
+        results = [{k: g[k] for k in LIST_FIELDS if k in g} for g in games[start:start + size]]
+        return 200, {
+            "count": len(games),
+            "next": link(page + 1) if start + size < len(games) else None,
+            "previous": link(page - 1) if page > 1 else None,
+            "results": results,
+        }
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=None, headers=None):
+                data = json.dumps(body if body is not None else {}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                time.sleep(server.latency.sample())
+                parts = urlsplit(self.path)
+                query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+                path = parts.path.rstrip("/").split("/")
+                fault = server._fault()
+                if fault == 429:
+                    server._count("error")
+                    return self._send(429, {"detail": "Too many requests"}, {"Retry-After": str(server.retry_after)})
+                if fault == 502:
+                    server._count("error")
+                    return self._send(502)
+                if path[-1] == "games":
+                    server._count("list")
+                    url = f"http://{self.headers.get('Host')}{parts.path}"
+                    return self._send(*server.list_page(query, url))
+                if len(path) >= 2 and path[-1].isdigit() and path[-2] == "games":
+                    rid = int(path[-1])
+                    if rid in server.bad_ids:
+                        server._count("error")
+                        return self._send(502)
+                    server._count("detail")
+                    game = server.games.get(rid)
+                    return self._send(200, game) if game else self._send(404, {"detail": "Not found."})
+                if len(path) >= 2 and path[-1].isdigit() and path[-2] in ("developers", "publishers"):
+                    server._count("entity")
+                    prof = server.entities.get((path[-2], int(path[-1])))
+                    return self._send(200, prof) if prof else self._send(404, {"detail": "Not found."})
+                return self._send(404, {"detail": "Not found."})
+
+        return Handler
@@ -0,0 +1,178 @@
+"""Fetch-path telemetry: latency histograms, bytes, retries, status codes and rolling req/s per endpoint."""
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from .config import TELEMETRY_BUCKETS_MS, TELEMETRY_REPORT_PATH, TELEMETRY_WINDOW
+
+
+def endpoint_name(url: str) -> str:
+    """``"list"`` / ``"detail"`` for ``/games`` URLs, the entity kind (``"developers"``, ...) otherwise."""
+    parts = urlsplit(url).path.rstrip("/").split("/")
+    if parts[-1].isdigit() and len(parts) >= 2:
+        return "detail" if parts[-2] == "games" else parts[-2]
+    return "list"
+
+
+class _Endpoint:
+    __slots__ = ("hist", "count", "total_s", "max_s", "bytes_wire", "bytes_body", "retries", "cache_hits",
+                 "status")
+
+    def __init__(self, n_buckets: int):
+        self.hist = [0] * n_buckets
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.bytes_wire = 0
+        self.bytes_body = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.status = {}
+
+
+class CrawlTelemetry:
+    """Counters the :class:`~game_market.client.RawgClient` updates on every request.
+
+    Each network call costs one lock and a ``bisect`` into fixed latency
+    buckets (``buckets_ms`` plus an overflow bucket), so telemetry can stay
+    on in real crawls. Per endpoint it keeps the histogram, bytes on the wire
+    and decoded, retries, cache hits and a count per status code
+    (``"error"`` for connection errors/timeouts). ``rate()`` is requests/sec
+    over the last ``window`` seconds.
+
+    :meth:`report` returns everything as a dict with approximate p50/p90/p99
+    read from the histogram; :meth:`write_report` saves it as JSON.
+    :meth:`progress_line` is a one-line summary, which :meth:`start_live`
+    prints every ``interval`` seconds from a background thread.
+    """
+
+    def __init__(self, buckets_ms=TELEMETRY_BUCKETS_MS, window: float = TELEMETRY_WINDOW):
+        self.bounds = [b / 1000 for b in buckets_ms]
+        self.buckets_ms = list(buckets_ms)
+        self.window = window
+        self.started = time.time()
+        self.endpoints = {}
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self._live = None
+
+    def _ep(self, endpoint: str) -> _Endpoint:
+        ep = self.endpoints.get(endpoint)
+        if ep is None:
+            ep = self.endpoints[endpoint] = _Endpoint(len(self.bounds) + 1)
+        return ep
+
+    def record(self, url: str, status, seconds: float, bytes_wire: int = 0, bytes_body: int = 0) -> None:
+        """One network response (``status`` code, or ``"error"`` when no response came back)."""
+        now = time.monotonic()
+        with self._lock:
+            ep = self._ep(endpoint_name(url))
+            ep.hist[bisect.bisect_left(self.bounds, seconds)] += 1
+            ep.count += 1
+            ep.total_s += seconds
+            ep.max_s = max(ep.max_s, seconds)
+            ep.bytes_wire += bytes_wire
+            ep.bytes_body += bytes_body
+            ep.status[status] = ep.status.get(status, 0) + 1
+            self._recent.append(now)
+            while self._recent and self._recent[0] < now - self.window:
+                self._recent.popleft()
+
+    def retry(self, url: str) -> None:
+        with self._lock:
+            self._ep(endpoint_name(url)).retries += 1
+
+    def cache_hit(self, url: str) -> None:
+        with self._lock:
+            self._ep(endpoint_name(url)).cache_hits += 1
+
+    def rate(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and self._recent[0] < now - self.window:
+                self._recent.popleft()
+            n = len(self._recent)
+        return n / min(self.window, max(time.time() - self.started, 1e-9))
+
+    def _quantile(self, hist, count, q: float):
+        """Upper bound (ms) of the bucket holding quantile ``q``; ``None`` past the last bound."""
+        if not count:
+            return None
+        target, seen = q * count, 0
+        for i, n in enumerate(hist):
+            seen += n
+            if seen >= target:
+                return self.buckets_ms[i] if i < len(self.buckets_ms) else None
+        return None
+
+    def report(self) -> dict:
+        elapsed = time.time() - self.started
+        with self._lock:
+            endpoints = {}
+            for name, ep in sorted(self.endpoints.items()):
+                errors = sum(n for s, n in ep.status.items() if s == "error" or int(s) >= 400)
+                endpoints[name] = {
+                    "requests": ep.count,
+                    "cache_hits": ep.cache_hits,
+                    "retries": ep.retries,
+                    "error_rate": round(errors / ep.count, 4) if ep.count else 0.0,
+                    "status": {str(s): n for s, n in sorted(ep.status.items(), key=lambda kv: str(kv[0]))},
+                    "bytes_wire": ep.bytes_wire,
+                    "bytes_body": ep.bytes_body,
+                    "mean_ms": round(ep.total_s / ep.count * 1000, 1) if ep.count else None,
+                    "max_ms": round(ep.max_s * 1000, 1),
+                    "p50_ms": self._quantile(ep.hist, ep.count, 0.50),
+                    "p90_ms": self._quantile(ep.hist, ep.count, 0.90),
+                    "p99_ms": self._quantile(ep.hist, ep.count, 0.99),
+                    "histogram": dict(zip([f"<={b}" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}"],
+                                          ep.hist)),
+                }
+            total = sum(ep.count for ep in self.endpoints.values())
+        return {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "elapsed_s": round(elapsed, 1),
+            "requests": total,
+            "req_per_s": round(total / elapsed, 2) if elapsed else None,
+            "endpoints": endpoints,
+        }
+
+    def write_report(self, path: str = TELEMETRY_REPORT_PATH) -> str:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def progress_line(self) -> str:
+        with self._lock:
+            parts = []
+            for name, ep in sorted(self.endpoints.items()):
+                errors = sum(n for s, n in ep.status.items() if s == "error" or int(s) >= 400)
+                p50 = self._quantile(ep.hist, ep.count, 0.50)
+                parts.append(f"{name} {ep.count} (p50≤{p50}ms, hata {errors}, retry {ep.retries})")
+        return f"{self.rate():.1f} req/s | " + " | ".join(parts)
+
+    def start_live(self, interval: float = 5.0) -> None:
+        """Print :meth:`progress_line` every ``interval`` seconds until :meth:`stop_live`."""
+        if self._live is not None:
+            return
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(interval):
+                print(">> [telemetri]", self.progress_line(), flush=True)
+
+        thread = threading.Thread(target=loop, daemon=True)
+        thread.start()
+        self._live = (stop, thread)
+
+    def stop_live(self) -> None:
+        if self._live is not None:
+            stop, thread = self._live
+            stop.set()
+            thread.join()
+            self._live = None
@@ -0,0 +1,121 @@
+"""Interned entity names: alias folding and stable integer ids per list field, saved next to the dataset."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .config import ENTITY_ALIASES, ENTITY_VOCAB_PATH
+from .dataset import LIST_FIELDS
+from .explode import explode_codes
+from .incidence import Incidence
+
+
+class EntityVocab:
+    """Name → integer id, one id space per list field (``genres``, ``developers``, ...).
+
+    Names are folded before interning. An alias table entry wins
+    (``ENTITY_ALIASES``; its ``stores`` table is the old ``store_mapping``).
+    Otherwise spellings that differ only in case or spacing ("NAMCO" /
+    "Namco") share one id, and the first spelling seen becomes the display
+    name. Ids never change once given: a vocabulary saved with one dataset
+    version codes the next one the same way, and every section groups on
+    the same small integer keys.
+    """
+
+    def __init__(self, aliases=None, fold_case: bool = True):
+        self.aliases = {f: dict(m) for f, m in (ENTITY_ALIASES if aliases is None else aliases).items()}
+        self.fold_case = fold_case
+        self._alias_keys = {f: {self.key(a): b for a, b in m.items()} for f, m in self.aliases.items()}
+        self._names = {}    # alan → [görünen isim]
+        self._ids = {}      # alan → {anahtar: kimlik}
+
+    def key(self, name: str) -> str:
+        """Lookup key: whitespace collapsed and, with ``fold_case``, case-folded."""
+        name = " ".join(name.split())
+        return name.casefold() if self.fold_case else name
+
+    def canonical(self, field: str, name: str) -> str:
+        """Name after the alias table (spacing normalized)."""
+        name = " ".join(name.split())
+        return self._alias_keys.get(field, {}).get(self.key(name), name)
+
+    def intern(self, field: str, name: str) -> int:
+        """Id of ``name`` in ``field``, given a new id the first time it is seen."""
+        name = self.canonical(field, name)
+        ids = self._ids.setdefault(field, {})
+        k = self.key(name)
+        i = ids.get(k)
+        if i is None:
+            names = self._names.setdefault(field, [])
+            i = ids[k] = len(names)
+            names.append(name)
+        return i
+
+    def names(self, field: str) -> np.ndarray:
+        """Display names indexed by id."""
+        return np.asarray(self._names.get(field, []), dtype=object)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._names.values())
+
+    def incidence(self, s: pd.Series, field: str, exclude=None) -> Incidence:
+        """Game × entity :class:`~game_market.incidence.Incidence` of a comma-joined column in this id space.
+
+        Only the distinct names are interned (see
+        :func:`~game_market.explode.explode_codes`). Columns cover the whole
+        vocabulary, so entities absent from ``s`` have zero totals. A name
+        in ``exclude`` (raw or canonical) is dropped.
+        """
+        game_idx, local, names = explode_codes(s)
+        ids = np.fromiter((self.intern(field, n) for n in names), dtype=np.int32, count=len(names))
+        indices = ids[local]
+        if exclude:
+            exclude = set(exclude)
+            drop = np.fromiter((n in exclude or self.canonical(field, n) in exclude for n in names),
+                               dtype=bool, count=len(names))
+            keep = ~drop[local]
+            game_idx, indices = game_idx[keep], indices[keep]
+        indptr = np.zeros(len(s) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(game_idx, minlength=len(s)), out=indptr[1:])
+        return Incidence(indptr, indices, self.names(field))
+
+    def incidences(self, df: pd.DataFrame, fields=LIST_FIELDS) -> dict:
+        """``{field: Incidence}`` for every listed column ``df`` has."""
+        return {f: self.incidence(df[f], f) for f in fields if f in df.columns}
+
+    def save(self, path: str = ENTITY_VOCAB_PATH) -> None:
+        """Write aliases and id → name lists as JSON (atomic rename)."""
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"fold_case": self.fold_case, "aliases": self.aliases, "names": self._names},
+                      fh, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str = ENTITY_VOCAB_PATH, aliases=None) -> "EntityVocab":
+        """Vocabulary written by :meth:`save`; ``aliases`` replaces the saved alias table."""
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        vocab = cls(data["aliases"] if aliases is None else aliases, data.get("fold_case", True))
+        for field, names in data["names"].items():
+            vocab._names[field] = list(names)
+            ids = vocab._ids[field] = {}
+            for i, name in enumerate(names):
+                ids.setdefault(vocab.key(name), i)
+        return vocab
+
+
+def load_vocab(path: str = ENTITY_VOCAB_PATH, aliases=None) -> EntityVocab:
+    """Saved vocabulary at ``path``, or a new one if none was saved yet.
+
+    The alias table is ``ENTITY_ALIASES`` unless given, so edits to it
+    apply to names interned from now on.
+    """
+    aliases = ENTITY_ALIASES if aliases is None else aliases
+    if os.path.exists(path):
+        return EntityVocab.load(path, aliases)
+    return EntityVocab(aliases)